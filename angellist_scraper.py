@@ -3,16 +3,21 @@ AngelList (Wellfound) scraper - Optimized for 50+ results.
 Uses multiple strategies: search, filtering, and API endpoints.
 """
 
-import requests
+import asyncio
+import hashlib
 import json
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
+import aiohttp
+import orjson
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from base import normalize_startup, logger, clean_text
+from base import normalize_startup, logger, clean_text, make_session, make_client_session, select_first, HTML_PARSER, RateLimiter
 
 BASE_URL = "https://wellfound.com"
 GRAPHQL_URL = "https://wellfound.com/graphql"
+HTML_LOCATIONS = ["india", "bangalore", "mumbai", "delhi", "hyderabad", "pune", "chennai"]
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.0",
@@ -21,6 +26,70 @@ HEADERS = {
     "Referer": "https://wellfound.com/companies",
     "X-Requested-With": "XMLHttpRequest"
 }
+# GraphQL bodies are pre-serialized with orjson and sent as `data=`
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+GRAPHQL_QUERY = """
+query SearchCompanies($cursor: String, $filters: CompanySearchFilters!) {
+  companySearch(first: 20, after: $cursor, filters: $filters) {
+    edges {
+      node {
+        id
+        name
+        slug
+        websiteUrl
+        oneLiner
+        locations
+        industries
+        fundingStage
+        employeeCount
+      }
+      cursor
+    }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+  }
+}
+"""
+
+# Automatic Persisted Queries: the first request registers the query
+# under its hash, later pages send only the hash
+PERSISTED_QUERY = {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(GRAPHQL_QUERY.encode()).hexdigest()}}
+
+GRAPHQL_FILTERS = {
+    "locations": ["india"],
+    "companyStages": ["seed", "series_a", "series_b", "early_stage"]
+}
+
+# CSS selectors compiled once. Card layouts are tried in order because the
+# substring matches would also pick up nested parts like companyCardHeader.
+CARD_SELECTORS = tuple(
+    sv.compile(s) for s in (
+        "[data-test='company-card']", ".companyCard", "[class*='companyCard']", "div[class*='styles_companyCard']"
+    )
+)
+NAME_SELECTORS = tuple(sv.compile(s) for s in ("h2", "[data-test='company-name']", "a[class*='name']", "a"))
+DESC_SELECTORS = tuple(sv.compile(s) for s in ("[data-test='company-description']", "p[class*='description']", "p"))
+WEBSITE_SELECTOR = sv.compile("a[href^='http']")
+JSON_SCRIPT_SELECTOR = sv.compile("script[type='application/json']")
+
+# Shared keep-alive session: paginated GraphQL and HTML calls reuse one TLS connection.
+# Responses are cached on disk (POST bodies are part of the cache key).
+SESSION = make_session(HEADERS, cache_name="angellist_cache")
+
+# One request budget for the whole host, shared by the GraphQL thread and all HTML tasks
+RATE_LIMIT = RateLimiter(5)
+
+
+def _persisted_query_error(data: Dict) -> Optional[str]:
+    """Return the APQ error message (e.g. PersistedQueryNotFound) if the server sent one."""
+    for error in data.get("errors") or []:
+        message = error.get("message", "")
+        if message.startswith("PersistedQuery"):
+            return message
+    return None
 
 
 def get_graphql_startups(limit: int = 50) -> List[Dict]:
@@ -31,52 +100,46 @@ def get_graphql_startups(limit: int = 50) -> List[Dict]:
     startups = []
     cursor = None
     
-    query = """
-    query SearchCompanies($cursor: String, $filters: CompanySearchFilters!) {
-      companySearch(first: 20, after: $cursor, filters: $filters) {
-        edges {
-          node {
-            id
-            name
-            slug
-            websiteUrl
-            oneLiner
-            locations
-            industries
-            fundingStage
-            employeeCount
-          }
-          cursor
-        }
-        pageInfo {
-          hasNextPage
-          endCursor
-        }
-      }
-    }
-    """
+    use_apq = True
+    send_query = True
+    
+    # Only the cursor changes between pages
+    variables = {"filters": GRAPHQL_FILTERS, "cursor": None}
     
     while len(startups) < limit:
-        variables = {
-            "filters": {
-                "locations": ["india"],
-                "companyStages": ["seed", "series_a", "series_b", "early_stage"]
-            },
-            "cursor": cursor
-        }
+        variables["cursor"] = cursor
+        
+        payload = {"variables": variables}
+        if use_apq:
+            payload["extensions"] = PERSISTED_QUERY
+        if send_query:
+            payload["query"] = GRAPHQL_QUERY
         
         try:
-            res = requests.post(
-                GRAPHQL_URL,
-                json={"query": query, "variables": variables},
-                headers={**HEADERS, "Content-Type": "application/json"},
-                timeout=15
-            )
+            with RATE_LIMIT:
+                res = SESSION.post(
+                    GRAPHQL_URL,
+                    data=orjson.dumps(payload),
+                    headers=JSON_CONTENT_TYPE,
+                    timeout=15
+                )
             
             if res.status_code != 200:
                 break
                 
-            data = res.json()
+            data = orjson.loads(res.content)
+            
+            apq_error = _persisted_query_error(data) if use_apq else None
+            if apq_error == "PersistedQueryNotSupported":
+                use_apq = False
+                send_query = True
+                continue
+            if apq_error and not send_query:
+                # Hash evicted server-side: register it again with the full query
+                send_query = True
+                continue
+            send_query = not use_apq
+            
             companies = data.get("data", {}).get("companySearch", {})
             edges = companies.get("edges", [])
             
@@ -85,7 +148,7 @@ def get_graphql_startups(limit: int = 50) -> List[Dict]:
                 if not node:
                     continue
                     
-                startups.append(normalize_startup(
+                startup = normalize_startup(
                     company_name=node.get("name", ""),
                     website=node.get("websiteUrl", ""),
                     description=node.get("oneLiner", ""),
@@ -94,7 +157,9 @@ def get_graphql_startups(limit: int = 50) -> List[Dict]:
                     location="India",
                     funding_stage=node.get("fundingStage", ""),
                     employee_count=str(node.get("employeeCount", ""))
-                ))
+                )
+                if startup:
+                    startups.append(startup)
                 
                 if len(startups) >= limit:
                     break
@@ -104,8 +169,6 @@ def get_graphql_startups(limit: int = 50) -> List[Dict]:
                 break
             cursor = page_info.get("endCursor")
             
-            time.sleep(0.5)
-            
         except Exception as e:
             logger.error(f"GraphQL fetch error: {e}")
             break
@@ -113,132 +176,146 @@ def get_graphql_startups(limit: int = 50) -> List[Dict]:
     return startups
 
 
-def scrape_html_fallback(limit: int = 50) -> List[Dict]:
+def _parse_company_cards(html: str, location: str) -> Optional[List[Dict]]:
     """
-    Fallback HTML scraping when API fails.
-    Uses multiple location filters to get more results.
+    Parse one Wellfound listing page.
+    Returns None when the page has no company cards (end of results).
     """
-    startups = []
-    locations = ["india", "bangalore", "mumbai", "delhi", "hyderabad", "pune", "chennai"]
+    soup = BeautifulSoup(html, HTML_PARSER)
     
-    for location in locations:
-        if len(startups) >= limit:
+    cards = []
+    for selector in CARD_SELECTORS:
+        cards = selector.select(soup)
+        if cards:
             break
-            
-        page = 1
-        location_count = 0
-        max_per_location = limit // len(locations) + 10
-        
-        while location_count < max_per_location and len(startups) < limit:
-            url = f"{BASE_URL}/companies?page={page}&locations={location}&stage=seed&stage=series_a"
-            
+    
+    if not cards:
+        # Try JSON embedded in script
+        scripts = JSON_SCRIPT_SELECTOR.select(soup)
+        for script in scripts:
             try:
-                res = requests.get(url, headers=HEADERS, timeout=10)
-                if res.status_code != 200:
-                    break
-                
-                soup = BeautifulSoup(res.text, "html.parser")
+                data = json.loads(script.string)
+                if "props" in data:
+                    # Extract from Next.js data
+                    pass
+            except:
+                continue
+        return None
+    
+    startups = []
+    for card in cards:
+        try:
+            name_elem = select_first(card, NAME_SELECTORS)
+            
+            if not name_elem:
+                continue
                 
-                # Multiple selector strategies
-                cards = (
-                    soup.select("[data-test='company-card']") or
-                    soup.select(".companyCard") or
-                    soup.select("[class*='companyCard']") or
-                    soup.select("div[class*='styles_companyCard']")
+            name = clean_text(name_elem.get_text())
+            link = name_elem.get("href", "") if name_elem.name == "a" else ""
+            
+            # Extract website if available
+            website = ""
+            website_elem = WEBSITE_SELECTOR.select_one(card)
+            if website_elem:
+                website = website_elem.get("href", "")
+            
+            # Extract description
+            desc = ""
+            desc_elem = select_first(card, DESC_SELECTORS)
+            if desc_elem:
+                desc = clean_text(desc_elem.get_text())
+            
+            if name and len(name) > 1:
+                startup = normalize_startup(
+                    company_name=name,
+                    website=website or (f"{BASE_URL}{link}" if link else ""),
+                    description=desc,
+                    source=f"angellist_{location}",
+                    confidence="high"
                 )
+                if startup:
+                    startups.append(startup)
                 
-                if not cards:
-                    # Try JSON embedded in script
-                    scripts = soup.find_all("script", type="application/json")
-                    for script in scripts:
-                        try:
-                            data = json.loads(script.string)
-                            if "props" in data:
-                                # Extract from Next.js data
-                                pass
-                        except:
-                            continue
+        except Exception as e:
+            logger.debug(f"Card parsing error: {e}")
+            continue
+    
+    return startups
+
+
+async def _scrape_location(session: aiohttp.ClientSession, location: str, max_per_location: int) -> List[Dict]:
+    """Page through one location filter until it runs dry or hits its quota."""
+    startups = []
+    page = 1
+    
+    while len(startups) < max_per_location:
+        url = f"{BASE_URL}/companies?page={page}&locations={location}&stage=seed&stage=series_a"
+        
+        try:
+            async with RATE_LIMIT, session.get(url) as res:
+                if res.status != 200:
                     break
-                
-                for card in cards:
-                    try:
-                        name_elem = (
-                            card.select_one("h2") or
-                            card.select_one("[data-test='company-name']") or
-                            card.select_one("a[class*='name']") or
-                            card.find("a")
-                        )
-                        
-                        if not name_elem:
-                            continue
-                            
-                        name = clean_text(name_elem.get_text())
-                        link = name_elem.get("href", "") if name_elem.name == "a" else ""
-                        
-                        # Extract website if available
-                        website = ""
-                        website_elem = card.select_one("a[href^='http']")
-                        if website_elem:
-                            website = website_elem.get("href", "")
-                        
-                        # Extract description
-                        desc = ""
-                        desc_elem = (
-                            card.select_one("[data-test='company-description']") or
-                            card.select_one("p[class*='description']") or
-                            card.select_one("p")
-                        )
-                        if desc_elem:
-                            desc = clean_text(desc_elem.get_text())
-                        
-                        if name and len(name) > 1:
-                            startups.append(normalize_startup(
-                                company_name=name,
-                                website=website or (f"{BASE_URL}{link}" if link else ""),
-                                description=desc,
-                                source=f"angellist_{location}",
-                                confidence="high"
-                            ))
-                            location_count += 1
-                            
-                    except Exception as e:
-                        logger.debug(f"Card parsing error: {e}")
-                        continue
-                
-                page += 1
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"HTML scrape error for {location}: {e}")
+                html = await res.text()
+            
+            page_startups = _parse_company_cards(html, location)
+            if page_startups is None:
                 break
+            startups.extend(page_startups)
+            
+            page += 1
+            
+        except Exception as e:
+            logger.error(f"HTML scrape error for {location}: {e}")
+            break
     
     return startups
 
 
+async def _scrape_html_fallback(limit: int) -> List[Dict]:
+    max_per_location = limit // len(HTML_LOCATIONS) + 10
+    
+    async with make_client_session(HEADERS, limit=20, limit_per_host=8, timeout=10) as session:
+        tasks = [
+            asyncio.create_task(_scrape_location(session, location, max_per_location))
+            for location in HTML_LOCATIONS
+        ]
+        results = await asyncio.gather(*tasks)
+    
+    # Keep location order so the output is deterministic
+    startups = [s for location_startups in results for s in location_startups]
+    return startups[:limit]
+
+
+def scrape_html_fallback(limit: int = 50) -> List[Dict]:
+    """
+    Fallback HTML scraping when API fails.
+    Scrapes multiple location filters concurrently to get more results.
+    """
+    return asyncio.run(_scrape_html_fallback(limit))
+
+
 def collect_angellist_startups(limit: int = 50) -> List[Dict]:
     """
     Collect startups from AngelList/Wellfound.
-    Tries GraphQL API first, falls back to HTML scraping.
+    Runs the GraphQL API and HTML scraping concurrently; GraphQL results win on duplicates.
     """
     logger.info(f"Fetching AngelList startups (target: {limit})...")
     
-    # Try GraphQL first
-    startups = get_graphql_startups(limit)
-    logger.info(f"GraphQL fetch: {len(startups)} startups")
-    
-    # Fallback to HTML if needed
-    if len(startups) < limit:
-        remaining = limit - len(startups)
-        html_startups = scrape_html_fallback(remaining)
-        
-        # Deduplicate
-        existing_ids = {s["startup_id"] for s in startups}
-        for s in html_startups:
-            if s["startup_id"] not in existing_ids:
-                startups.append(s)
-                existing_ids.add(s["startup_id"])
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        graphql_future = executor.submit(get_graphql_startups, limit)
+        html_future = executor.submit(scrape_html_fallback, limit)
         
-        logger.info(f"After HTML fallback: {len(startups)} startups")
+        startups = graphql_future.result()
+        logger.info(f"GraphQL fetch: {len(startups)} startups")
+        html_startups = html_future.result()
+    
+    # Deduplicate: one dict merge, GraphQL entries keep their slot
+    merged = {s["startup_id"]: s for s in startups}
+    for s in html_startups:
+        merged.setdefault(s["startup_id"], s)
+    startups = list(merged.values())
+    
+    logger.info(f"After HTML fallback: {len(startups)} startups")
     
     return startups[:limit]
 
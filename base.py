@@ -1,14 +1,40 @@
 import hashlib
 import asyncio
 import aiohttp
+import orjson
 import logging
-from datetime import datetime
+import os
+import threading
+import time
+from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, MISSING
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
 import json
 import re
 import html
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader, MaxRetryError
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # on-disk HTTP caching is optional
+    requests_cache = None
+
+try:
+    import aiohttp_client_cache
+except ImportError:  # same, for the aiohttp sessions
+    aiohttp_client_cache = None
+
+# BeautifulSoup backend: lxml's C parser when available, stdlib otherwise
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # Configure logging
 logging.basicConfig(
@@ -17,8 +43,191 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Transient statuses worth retrying at the adapter level
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Seconds to keep cached HTTP responses on disk; 0 always fetches fresh data
+HTTP_CACHE_EXPIRE = int(os.getenv("SCRAPER_CACHE_EXPIRE", "3600"))
+# Where aiohttp response caches live (requests-cache picks its own user cache dir)
+HTTP_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache"))
+
+
+def make_session(
+    headers: Optional[Dict[str, str]] = None,
+    pool_connections: int = 20,
+    pool_maxsize: int = 20,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    cache_name: Optional[str] = None,
+    **cache_options,
+) -> requests.Session:
+    """
+    Build a requests.Session with a pooled, retrying HTTPAdapter.
+    Keep-alive connections are reused across calls to the same host.
+    With cache_name (and requests-cache installed), GET/POST responses are
+    cached in a SQLite file under the user cache dir for HTTP_CACHE_EXPIRE seconds.
+    """
+    if cache_name and requests_cache is not None and HTTP_CACHE_EXPIRE > 0:
+        session = requests_cache.CachedSession(
+            cache_name,
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=HTTP_CACHE_EXPIRE,
+            allowable_methods=("GET", "POST"),
+            **cache_options,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            # GraphQL searches are read-only POSTs
+            allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+            # Wait as long as a 429/503 asks; the final response is returned as-is
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def make_client_session(
+    headers: Optional[Dict[str, str]] = None,
+    limit: int = 20,
+    limit_per_host: int = 8,
+    timeout: float = 10,
+    ttl_dns_cache: int = 300,
+    cache_name: Optional[str] = None,
+) -> aiohttp.ClientSession:
+    """
+    aiohttp counterpart of make_session: one pooled keep-alive connector
+    and a total per-request timeout. Create it inside the running event loop
+    (`async with make_client_session(...) as session:`).
+    Resolved addresses are cached for `ttl_dns_cache` seconds (aiohttp's
+    default is 10), so reconnects to a host skip the DNS round trip.
+    With cache_name (and aiohttp-client-cache installed), successful GET
+    responses are cached in HTTP_CACHE_DIR for HTTP_CACHE_EXPIRE seconds.
+    """
+    options = dict(
+        headers=headers,
+        connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=ttl_dns_cache),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    )
+    if cache_name and aiohttp_client_cache is not None and HTTP_CACHE_EXPIRE > 0:
+        backend = aiohttp_client_cache.SQLiteBackend(
+            os.path.join(HTTP_CACHE_DIR, f"{cache_name}.sqlite"),
+            expire_after=HTTP_CACHE_EXPIRE,
+            allowed_codes=(200,),
+            allowed_methods=("GET",),
+        )
+        return aiohttp_client_cache.CachedSession(cache=backend, **options)
+    return aiohttp.ClientSession(**options)
+
+
+async def get_with_retry(
+    session: aiohttp.ClientSession,
+    url: str,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    max_bytes: Optional[int] = None,
+    **kwargs,
+) -> tuple[aiohttp.ClientResponse, bytes]:
+    """
+    GET `url` and read the body, retrying RETRY_STATUSES replies the way
+    make_session's adapter does: exponential backoff, or the server's
+    Retry-After when it sends one. Returns the final (released) response,
+    whose status and headers stay readable, and its body; with max_bytes,
+    at most that much of the body is downloaded.
+    Connection errors and timeouts propagate to the caller.
+    """
+    retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUSES)
+    while True:
+        async with session.get(url, **kwargs) as res:
+            if max_bytes is None:
+                body = await res.read()
+            else:
+                buffer = bytearray()
+                async for chunk in res.content.iter_chunked(65536):
+                    buffer += chunk
+                    if len(buffer) >= max_bytes:
+                        break
+                body = bytes(buffer[:max_bytes])
+            retry_after = res.headers.get("Retry-After")
+        if not retry.is_retry("GET", res.status, retry_after is not None):
+            return res, body
+        try:
+            retry = retry.increment("GET", url)
+        except MaxRetryError:
+            return res, body
+        delay = retry.get_backoff_time()
+        if retry_after:
+            try:
+                delay = retry.parse_retry_after(retry_after)
+            except InvalidHeader:
+                pass
+        await asyncio.sleep(delay)
+
+class RateLimiter:
+    """
+    Token bucket shared by threads and asyncio tasks: allows a burst of
+    `rate` calls, then spaces calls `period / rate` seconds apart.
+    Use as `with limiter:` in sync code or `async with limiter:` in coroutines.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self._interval = period / rate
+        self._burst = period - self._interval
+        self._next_slot = 0.0
+        # Only guards the slot bookkeeping, never held while waiting
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+            return max(0.0, slot - self._burst - now)
+
+    def __enter__(self):
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    async def __aenter__(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _cached_now_iso(tick: int) -> str:
+    # Naive UTC, same format as the deprecated datetime.utcnow().isoformat()
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
 
-@dataclass
+
+def _now_iso() -> str:
+    """UTC timestamp for discovered_date, formatted at most once per second."""
+    return _cached_now_iso(int(time.time()))
+
+
+@dataclass(slots=True)
 class Startup:
     """Structured startup data model."""
     company_name: str
@@ -37,10 +246,32 @@ class Startup:
     
     def __post_init__(self):
         if not self.discovered_date:
-            self.discovered_date = datetime.utcnow().isoformat()
+            self.discovered_date = _now_iso()
         if not self.startup_id:
             self.startup_id = generate_id(self.company_name, self.website)
         self.company_name = self.company_name.strip()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of all fields (cheaper than dataclasses.asdict, which deep-copies)."""
+        return {
+            "company_name": self.company_name,
+            "source": self.source,
+            "website": self.website,
+            "description": self.description,
+            "location": self.location,
+            "discovered_date": self.discovered_date,
+            "confidence": self.confidence,
+            "startup_id": self.startup_id,
+            "industry": self.industry,
+            "funding_stage": self.funding_stage,
+            "employee_count": self.employee_count,
+            "is_valid_company": self.is_valid_company,
+            "validation_reason": self.validation_reason,
+        }
+
+
+# Field defaults in declaration order, used to build records without a Startup instance
+_STARTUP_DEFAULTS = {f.name: "" if f.default is MISSING else f.default for f in fields(Startup)}
 
 
 # Validation patterns for filtering out non-companies
@@ -108,6 +339,28 @@ COMPANY_VALIDATION_PATTERNS = {
     ]
 }
 
+# One alternation per category so each check is a single regex scan.
+# Inputs are lower-cased by the caller, so no IGNORECASE (it would turn
+# the CamelCase check into "any long word")
+_VALIDATION_RX = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns))
+    for category, patterns in COMPANY_VALIDATION_PATTERNS.items()
+}
+
+def _first_pattern(category: str, *texts: str) -> str:
+    """
+    The first pattern of `category`, in list order, that matches any of `texts`.
+    Rejection reasons name this one, as the per-pattern loop did; the
+    combined regex's leftmost match can come from a later pattern.
+    """
+    for pattern in COMPANY_VALIDATION_PATTERNS[category]:
+        if any(re.search(pattern, text) for text in texts):
+            return pattern
+    return ""
+
+_CONTROL_CHARS = dict.fromkeys([*range(0x20), 0x7F])
+
+
 def clean_text(text: str) -> str:
     """
     Normalize and clean scraped text safely.
@@ -118,19 +371,52 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     text = html.unescape(text)
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\x20-\x7E]", "", text)
+    text = " ".join(text.split())
+    # Keep printable ASCII only: drop non-ASCII, then the remaining control chars
+    text = text.encode("ascii", "ignore").decode("ascii").translate(_CONTROL_CHARS)
     return text.strip()
 
+# Next.js page data; its JSON escapes "<", so the first </script> ends it
+_NEXT_DATA_RE = re.compile(rb"""<script[^>]*\bid=["']?__NEXT_DATA__["']?[^>]*>(.*?)</script>""", re.DOTALL)
+
+def next_page_props(content: bytes) -> Dict[str, Any]:
+    """
+    props.pageProps from a Next.js page's __NEXT_DATA__ script, read straight
+    from the raw bytes (no soup, no intermediate str); {} when absent or invalid.
+    """
+    match = _NEXT_DATA_RE.search(content)
+    if not match:
+        return {}
+    try:
+        page_props = orjson.loads(match.group(1))["props"]["pageProps"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return {}
+    return page_props if isinstance(page_props, dict) else {}
+
+def select_first(tag, selectors):
+    """
+    Return the first match from an ordered sequence of compiled
+    soupsieve selectors, honouring their priority (not document order).
+    """
+    for selector in selectors:
+        match = selector.select_one(tag)
+        if match is not None:
+            return match
+    return None
+
+@lru_cache(maxsize=4096)
 def generate_id(name: str, website: str = "") -> str:
-    """Generate unique ID for deduplication."""
+    """Generate unique ID for deduplication. Pure, so repeated names hit the cache."""
     key = f"{name.lower().strip()}|{website.lower().strip()}"
-    return hashlib.sha256(key.encode()).hexdigest()[:16]
+    # 8-byte BLAKE2b digest = the same 16 hex chars, without truncating a SHA-256
+    return hashlib.blake2b(key.encode("utf-8", "ignore"), digest_size=8).hexdigest()
 
+@lru_cache(maxsize=8192)
 def is_valid_company(name: str, description: str = "", source: str = "") -> tuple[bool, str]:
     """
     Validate if this is a real company, not an article or placeholder.
-    Returns (is_valid, reason)
+    Returns (is_valid, reason). Pure function of its arguments, so results
+    are memoized: the same company surfacing on several pages is checked once.
     """
     if not name or len(name) < 2:
         return False, "empty_or_too_short_name"
@@ -140,49 +426,70 @@ def is_valid_company(name: str, description: str = "", source: str = "") -> tupl
     source_lower = (source or "").lower()
     
     # Check 1: Article patterns in name
-    for pattern in COMPANY_VALIDATION_PATTERNS['article_patterns']:
-        if re.search(pattern, name_lower):
-            return False, f"article_title_detected: {pattern}"
+    if _VALIDATION_RX['article_patterns'].search(name_lower):
+        return False, f"article_title_detected: {_first_pattern('article_patterns', name_lower)}"
     
     # Check 2: Fake/placeholder patterns
-    for pattern in COMPANY_VALIDATION_PATTERNS['fake_patterns']:
-        if re.search(pattern, name_lower):
-            return False, f"fake_placeholder_detected: {pattern}"
+    if _VALIDATION_RX['fake_patterns'].search(name_lower):
+        return False, f"fake_placeholder_detected: {_first_pattern('fake_patterns', name_lower)}"
     
     # Check 3: Government initiatives (not startups)
-    for pattern in COMPANY_VALIDATION_PATTERNS['government_patterns']:
-        if re.search(pattern, name_lower) or re.search(pattern, desc_lower):
-            return False, f"government_initiative_detected: {pattern}"
+    government_rx = _VALIDATION_RX['government_patterns']
+    if government_rx.search(name_lower) or government_rx.search(desc_lower):
+        return False, f"government_initiative_detected: {_first_pattern('government_patterns', name_lower, desc_lower)}"
     
     # Check 4: Source-based rejection
     if 'stealth_signals' in source_lower:
         return False, "stealth_mode_not_verifiable"
     
-    if 'features' in source_lower and not any(
-        re.search(p, desc_lower) for p in COMPANY_VALIDATION_PATTERNS['company_indicators']
-    ):
-        return False, "likely_article_no_company_indicators"
-    
-    # Check 5: Must have company indicators OR valid suffix
-    has_company_indicators = any(
-        re.search(p, desc_lower) for p in COMPANY_VALIDATION_PATTERNS['company_indicators']
-    )
-    
-    has_valid_suffix = any(
-        re.search(p, name_lower) for p in COMPANY_VALIDATION_PATTERNS['valid_company_suffixes']
-    )
-    
     # Check if it looks like a proper noun (capitalized words)
     words = name.split()
     looks_like_company = len(words) <= 4 and all(w[0].isupper() for w in words if w)
     
-    if not (has_company_indicators or has_valid_suffix or looks_like_company):
-        # Allow if name is short and capitalized (might be a startup name)
-        if len(name) > 20 or not looks_like_company:
+    if 'features' in source_lower:
+        if not _VALIDATION_RX['company_indicators'].search(desc_lower):
+            return False, "likely_article_no_company_indicators"
+    elif looks_like_company:
+        # Capitalized short names pass Check 5 regardless of indicators/suffix
+        return True, "passed_validation"
+    
+    # Check 5: Must have company indicators OR valid suffix
+    if not looks_like_company:
+        has_company_indicators = bool(_VALIDATION_RX['company_indicators'].search(desc_lower))
+        has_valid_suffix = bool(_VALIDATION_RX['valid_company_suffixes'].search(name_lower))
+        if not (has_company_indicators or has_valid_suffix):
             return False, "no_company_indicators_found"
     
     return True, "passed_validation"
 
+@lru_cache(maxsize=4096)
+def _startup_record(
+    company_name: str,
+    source: str,
+    website: str,
+    description: str,
+    location: str,
+    confidence: str,
+    reason: str,
+    extra: tuple,
+) -> Dict[str, Any]:
+    """Everything normalize_startup returns except discovered_date. Shared: copy before use."""
+    # Build the record directly (same keys/values as Startup(...).to_dict())
+    record = dict(_STARTUP_DEFAULTS)
+    record.update(extra)
+    record.update(
+        company_name=company_name.strip(),
+        source=source,
+        website=website,
+        description=description,
+        location=location,
+        confidence=confidence,
+        validation_reason=reason,
+    )
+    if not record["startup_id"]:
+        record["startup_id"] = generate_id(company_name, website)
+    return record
+
 def normalize_startup(
     company_name: str,
     source: str,
@@ -204,33 +511,34 @@ def normalize_startup(
         logger.warning(f"REJECTED '{company_name}' from {source}: {reason}")
         return None
     
-    startup = Startup(
-        company_name=company_name,
-        source=source,
-        website=website,
-        description=description,
-        location=location,
-        discovered_date=discovered_date or datetime.utcnow().isoformat(),
-        confidence=confidence,
-        validation_reason=reason,
-        **kwargs
-    )
-    return asdict(startup)
+    unknown = kwargs.keys() - _STARTUP_DEFAULTS.keys()
+    if unknown:
+        raise TypeError(f"normalize_startup() got unexpected keyword arguments: {sorted(unknown)}")
+    # Set from validation above; passing it too collided in Startup(...) before
+    if "validation_reason" in kwargs:
+        raise TypeError("normalize_startup() got multiple values for keyword argument 'validation_reason'")
+    
+    # Records are cached without their timestamp; every call gets its own copy
+    extra = tuple(kwargs.items())
+    try:
+        template = _startup_record(company_name, source, website, description, location, confidence, reason, extra)
+    except TypeError:  # unhashable extra field value (e.g. a list)
+        template = _startup_record.__wrapped__(company_name, source, website, description, location, confidence, reason, extra)
+    record = dict(template)
+    record["discovered_date"] = discovered_date or _now_iso()
+    return record
 
 def deduplicate(startups: List[Dict]) -> List[Dict]:
     """Remove duplicates based on startup_id and filter out None values."""
-    # Filter out None first
-    startups = [s for s in startups if s is not None]
-    
-    seen = set()
-    result = []
+    # Insertion-ordered dict: one pass, first occurrence of each ID wins
+    unique: Dict[str, Dict] = {}
     for s in startups:
+        if s is None:
+            continue
         sid = s.get("startup_id") or generate_id(s.get("company_name", ""), s.get("website", ""))
-        if sid not in seen:
-            seen.add(sid)
-            s["startup_id"] = sid
-            result.append(s)
-    return result
+        s["startup_id"] = sid
+        unique.setdefault(sid, s)
+    return list(unique.values())
 
 def filter_valid_startups(startups: List[Dict]) -> List[Dict]:
     """Filter list to only valid companies."""
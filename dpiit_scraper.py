@@ -3,107 +3,160 @@ DPIIT/Startup India portal scraper - Optimized for 50+ results.
 Uses official API endpoints and multi-parameter search.
 """
 
-import requests
-import json
-import time
-from typing import List, Dict
-from base import normalize_startup, logger, clean_text
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+import orjson
+import soupsieve as sv
+from base import normalize_startup, logger, clean_text, make_session, HTML_PARSER, RateLimiter
 
 BASE_URL = "https://www.startupindia.gov.in"
 API_URL = "https://www.startupindia.gov.in/content/sih/en/search/jcr:content/root/responsivegrid/generic_search.search.json"
 
+API_HEADERS = {
+    "Accept": "application/json",
+    "X-Requested-With": "XMLHttpRequest",
+    "Referer": f"{BASE_URL}/content/sih/en/search.html",
+}
+
+# Search filters never change between pages, so serialize them once
+API_FILTERS = orjson.dumps({
+    "stages": [],
+    "industries": [],
+    "sectors": [],
+    "states": [],
+    "cities": [],
+    "dpiitRecognised": True,
+    "DPIIT recognised": True,
+}).decode()
+
+# CSS selectors compiled once. Card layouts are tried in order because
+# the last one (.card) is generic and would pull in unrelated markup.
+CARD_SELECTORS = tuple(
+    sv.compile(s) for s in (".search-result-card", "[data-testid='startup-card']", ".startup-card", ".card")
+)
+NAME_SELECTOR = sv.compile("h4, h3, h2, .title, [class*='name']")
+LINK_SELECTOR = sv.compile("a[href]")
+DESC_SELECTOR = sv.compile(".description, p, [class*='desc']")
+
+# Shared keep-alive session for the API and HTML directory (same host), cached on disk
+SESSION = make_session(
+    {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"},
+    cache_name="dpiit_cache",
+)
+
+# API and HTML directory hit the same host, so they share one request budget
+RATE_LIMIT = RateLimiter(4)
+
+
+def _fetch_api_page(page: int, batch_size: int) -> Optional[Dict]:
+    """Fetch one page of the search API; None on HTTP or decode failure."""
+    params = {
+        "page": page,
+        "results": batch_size,
+        "sort": "relevance",
+        "filters": API_FILTERS,
+    }
+    
+    with RATE_LIMIT:
+        res = SESSION.get(
+            API_URL,
+            params=params,
+            headers=API_HEADERS,
+            timeout=15
+        )
+    
+    if res.status_code != 200:
+        logger.warning(f"DPIIT API returned {res.status_code}")
+        return None
+    
+    # Safe parse: site may return HTML error page instead of JSON
+    try:
+        return orjson.loads(res.content)
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"DPIIT API returned non-JSON (may be HTML): {e}")
+        return None
+
+
+def _page_results(data: Dict) -> List[Dict]:
+    return data.get("results", []) or data.get("data", []) or data.get("searchResults", [])
+
+
+def _parse_api_results(results: List[Dict], startups: List[Dict], limit: int) -> None:
+    """Normalize API items into `startups` until it reaches `limit`."""
+    for item in results:
+        try:
+            name = item.get("name") or item.get("startupName") or item.get("companyName", "")
+            if not name:
+                continue
+            
+            website = item.get("website") or item.get("url") or ""
+            # Clean website URL
+            if website and not website.startswith("http"):
+                website = "https://" + website
+            
+            location = item.get("city", "") + ", " + item.get("state", "India")
+            location = location.strip(", ")
+            
+            startup = normalize_startup(
+                company_name=clean_text(name),
+                website=website,
+                description=item.get("description", "") or item.get("about", ""),
+                source="dpiit_api",
+                confidence="high",
+                location=location,
+                industry=item.get("industry", ""),
+                funding_stage=item.get("stage", "")
+            )
+            if startup:
+                startups.append(startup)
+            
+            if len(startups) >= limit:
+                break
+                
+        except Exception as e:
+            logger.debug(f"Item parsing error: {e}")
+            continue
+
 
 def fetch_api_startups(limit: int = 50) -> List[Dict]:
     """
     Fetch from Startup India JSON API.
     More reliable than HTML parsing.
+    When the first page reports a total, the remaining pages are fetched concurrently.
     """
     startups = []
-    offset = 0
+    page = 0
     batch_size = 20
     
     while len(startups) < limit:
-        params = {
-            "page": offset // batch_size,
-            "results": batch_size,
-            "sort": "relevance",
-            "filters": json.dumps({
-                "stages": [],
-                "industries": [],
-                "sectors": [],
-                "states": [],
-                "cities": [],
-                "dpiitRecognised": True,
-                "DPIIT recognised": True,
-            })
-        }
-        
         try:
-            res = requests.get(
-                API_URL,
-                params=params,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "application/json",
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Referer": f"{BASE_URL}/content/sih/en/search.html",
-                },
-                timeout=15
-            )
-            
-            if res.status_code != 200:
-                logger.warning(f"DPIIT API returned {res.status_code}")
-                break
-            
-            # Safe parse: site may return HTML error page instead of JSON
-            try:
-                data = res.json()
-            except (ValueError, json.JSONDecodeError) as e:
-                logger.warning(f"DPIIT API returned non-JSON (may be HTML): {e}")
+            data = _fetch_api_page(page, batch_size)
+            if data is None:
                 break
             
-            results = data.get("results", []) or data.get("data", []) or data.get("searchResults", [])
-            
+            results = _page_results(data)
             if not results:
                 break
             
-            for item in results:
-                try:
-                    name = item.get("name") or item.get("startupName") or item.get("companyName", "")
-                    if not name:
-                        continue
-                    
-                    website = item.get("website") or item.get("url") or ""
-                    # Clean website URL
-                    if website and not website.startswith("http"):
-                        website = "https://" + website
-                    
-                    location = item.get("city", "") + ", " + item.get("state", "India")
-                    location = location.strip(", ")
-                    
-                    startups.append(normalize_startup(
-                        company_name=clean_text(name),
-                        website=website,
-                        description=item.get("description", "") or item.get("about", ""),
-                        source="dpiit_api",
-                        confidence="high",
-                        location=location,
-                        industry=item.get("industry", ""),
-                        funding_stage=item.get("stage", "")
-                    ))
-                    
-                    if len(startups) >= limit:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Item parsing error: {e}")
-                    continue
-            
-            offset += batch_size
-            time.sleep(0.3)
+            _parse_api_results(results, startups, limit)
+            page += 1
             
             # Break if no more results
-            if len(results) < batch_size:
+            if len(results) < batch_size or len(startups) >= limit:
+                break
+            
+            total = data.get("totalResults") or data.get("totalCount")
+            if page == 1 and isinstance(total, int):
+                # Exact page count known: request every remaining page at once
+                # (still paced by RATE_LIMIT) instead of one round-trip per page
+                remaining = (limit - len(startups) + batch_size - 1) // batch_size
+                available = (total - batch_size + batch_size - 1) // batch_size
+                pages = range(1, 1 + min(remaining, available))
+                with ThreadPoolExecutor(max_workers=max(1, min(len(pages), 8))) as executor:
+                    for data in executor.map(lambda p: _fetch_api_page(p, batch_size), pages):
+                        if data is None or len(startups) >= limit:
+                            break
+                        _parse_api_results(_page_results(data), startups, limit)
                 break
                 
         except Exception as e:
@@ -126,37 +179,33 @@ def scrape_html_directory(limit: int = 50) -> List[Dict]:
         url = f"{BASE_URL}/content/sih/en/search.html?page={page}"
         
         try:
-            res = requests.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0"},
-                timeout=10
-            )
+            with RATE_LIMIT:
+                res = SESSION.get(url, timeout=10)
             
             if res.status_code != 200:
                 break
             
-            soup = BeautifulSoup(res.text, "html.parser")
+            soup = BeautifulSoup(res.text, HTML_PARSER)
             
-            # Multiple selector strategies
-            cards = (
-                soup.select(".search-result-card") or
-                soup.select("[data-testid='startup-card']") or
-                soup.select(".startup-card") or
-                soup.select(".card")
-            )
+            # First card layout present on the page wins
+            cards = []
+            for selector in CARD_SELECTORS:
+                cards = selector.select(soup)
+                if cards:
+                    break
             
             if not cards:
                 break
             
             for card in cards:
                 try:
-                    name_elem = card.select_one("h4, h3, h2, .title, [class*='name']")
+                    name_elem = NAME_SELECTOR.select_one(card)
                     if not name_elem:
                         continue
                     
                     name = clean_text(name_elem.get_text())
                     
-                    link_elem = card.select_one("a[href]")
+                    link_elem = LINK_SELECTOR.select_one(card)
                     website = ""
                     if link_elem:
                         href = link_elem.get("href", "")
@@ -165,24 +214,25 @@ def scrape_html_directory(limit: int = 50) -> List[Dict]:
                         elif href.startswith("/"):
                             website = BASE_URL + href
                     
-                    desc_elem = card.select_one(".description, p, [class*='desc']")
+                    desc_elem = DESC_SELECTOR.select_one(card)
                     description = clean_text(desc_elem.get_text()) if desc_elem else ""
                     
                     if name:
-                        startups.append(normalize_startup(
+                        startup = normalize_startup(
                             company_name=name,
                             website=website,
                             description=description,
                             source="dpiit_html",
                             confidence="high"
-                        ))
+                        )
+                        if startup:
+                            startups.append(startup)
                         
                 except Exception as e:
                     logger.debug(f"Card parse error: {e}")
                     continue
             
             page += 1
-            time.sleep(0.5)
             
         except Exception as e:
             logger.error(f"HTML scrape error: {e}")
@@ -235,20 +285,21 @@ def collect_dpiit_startups(limit: int = 50) -> List[Dict]:
     startups = []
 
     try:
-        # Primary: API fetch
-        startups = fetch_api_startups(limit)
-        logger.info(f"DPIIT API fetch: {len(startups)} startups")
+        # API and HTML directory are independent, so fetch both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            api_future = executor.submit(fetch_api_startups, limit)
+            html_future = executor.submit(scrape_html_directory, limit)
 
-        # Supplement with HTML if needed
-        if len(startups) < limit:
-            remaining = limit - len(startups)
+            startups = api_future.result()
+            logger.info(f"DPIIT API fetch: {len(startups)} startups")
+
+            # Supplement with HTML, API results take precedence
             try:
-                html_startups = scrape_html_directory(remaining)
-                existing_ids = {s["startup_id"] for s in startups}
+                html_startups = html_future.result()
+                merged = {s["startup_id"]: s for s in startups}
                 for s in html_startups:
-                    if s["startup_id"] not in existing_ids:
-                        startups.append(s)
-                        existing_ids.add(s["startup_id"])
+                    merged.setdefault(s["startup_id"], s)
+                startups = list(merged.values())
                 logger.info(f"DPIIT after HTML supplement: {len(startups)} startups")
             except Exception as e:
                 logger.warning(f"DPIIT HTML scrape failed: {e}")
@@ -256,10 +307,11 @@ def collect_dpiit_startups(limit: int = 50) -> List[Dict]:
         # Fallback so DPIIT source always appears in output
         if len(startups) < limit:
             fallback = _dpiit_fallback_startups(limit - len(startups))
-            existing_ids = {s["startup_id"] for s in startups}
+            merged = {s["startup_id"]: s for s in startups}
             for s in fallback:
-                if s["startup_id"] not in existing_ids:
-                    startups.append(s)
+                if s:
+                    merged.setdefault(s["startup_id"], s)
+            startups = list(merged.values())
             logger.info(f"DPIIT after fallback: {len(startups)} startups")
     except Exception as e:
         logger.error(f"DPIIT collection error: {e}, using fallback only")
@@ -3,17 +3,19 @@ Inc42 Scraper - Optimized for fetching 50+ startups with rich data
 Fetches from multiple Inc42 endpoints: startups to watch, funding news, and ecosystem lists
 """
 
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+import soupsieve as sv
 import time
-import random
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
-from base import normalize_startup
+from base import normalize_startup, deduplicate, HTML_PARSER, RateLimiter, make_session, make_client_session, get_with_retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -37,54 +39,164 @@ HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
-def extract_company_from_title(title: str) -> Optional[str]:
-    title = title.strip()
+# Keep-alive session for listing and funding pages (fetch_page).
+# Pool is sized for the parallel listings pass plus headroom;
+# the adapter retries 429/5xx and connection errors with exponential backoff.
+# Pages are cached on disk; expired entries are revalidated with ETag /
+# Last-Modified, and a cached copy is served if inc42.com errors out.
+SESSION = make_session(
+    HEADERS,
+    pool_connections=16,
+    pool_maxsize=64,
+    retries=3,
+    backoff_factor=1.0,
+    cache_name="inc42_cache",
+    stale_if_error=True,
+)
+
+# Size cap per page; anything bigger is truncated. Without requests-cache it
+# also caps the download. SESSION's CachedSession reads and stores the whole
+# body before fetch_page sees it, so there it only caps what gets decoded and parsed.
+MAX_PAGE_BYTES = 512 * 1024
+
+# Polite global pace for inc42.com, shared by every worker thread
+RATE_LIMIT = RateLimiter(4)
+
+# Concurrent article downloads per listings page (aiohttp)
+ARTICLE_CONCURRENCY = 16
+
+# Common patterns for article links on Inc42, as one selector so the page is walked once
+LISTING_LINK_SELECTOR = sv.compile(
+    "article h2 a, article h3 a, .post-title a, .entry-title a, .startup-card a, "
+    "a[href*='/startups/'], a[href*='/features/'], h2 a[href], h3 a[href]"
+)
+ARTICLE_TITLE_SELECTOR = sv.compile("h1, h2, .entry-title")
+# Article pages only need their headings, meta description, paragraphs and links;
+# scripts, styles and layout markup are never built into the tree
+ARTICLE_STRAINER = SoupStrainer(["h1", "h2", "meta", "p", "a"])
+ARTICLE_SELECTOR = sv.compile("article")
+HEADLINE_SELECTOR = sv.compile("h2, h3, .entry-title")
+LINK_SELECTOR = sv.compile("a")
+
+# Regexes compiled once at import (re's internal cache is small).
+# Title shapes are one anchored alternation tried in priority order;
+# exactly one group captures the company name.
+TITLE_RE = re.compile(
+    r"^(?:"
+    r"How\s+(.+?)\s+Is\s+"
+    r"|How\s+(.+?)\s+Has\s+"
+    r"|How\s+(.+?)\s+Uses\s+"
+    r"|How\s+(.+?)\s+Helps\s+"
+    r"|Why\s+(.+?)\s+"
+    r"|(.+?)’s\s+"
+    r"|(.+?)'s\s+"
+    r"|Inside\s+([A-Z][A-Za-z0-9&.\-]{2,20})$"
+    r")",
+    re.IGNORECASE,
+)
+
+INVALID_NAMES = frozenset({
+    "gig economy",
+    "startup",
+    "startups",
+    "guide",
+    "funding",
+    "economy",
+    "features",
+    "decoding",
+    "understanding",
+})
+COUNTRY_BLOCKLIST = frozenset({"india", "bharat", "indian", "usa", "china", "europe"})
+
+IMG_RE = re.compile(r"<img[^>]*>")
+SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL)
+STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL)
+TAG_RE = re.compile(r"<[^>]+>")
+WS_RE = re.compile(r"\s+")
+
+# Outbound (non-inc42) links; company sites must also carry a known TLD-ish suffix
+EXTERNAL_URL_RE = re.compile(r"^http(?!.*inc42\.com)", re.DOTALL)
+COMPANY_URL_RE = re.compile(r"^http(?!.*inc42\.com)(?=(?i:.*\.(?:com|in|io|ai|tech)))", re.DOTALL)
+
+# Pattern: "Startup Name Raises $X Million". One anchored regex whose branches
+# keep the old priority: the leftmost Raises-style match wins over any
+# Funding-style one, which wins over Announces/Launches.
+FUNDING_RE = re.compile(
+    r"^(?:"
+    r".*?([A-Z][\w\s&]+)\s+(?:Raises|Secures|Gets|Closes)"
+    r"|.*?([A-Z][\w\s&]+)\s+(?:Funding|Investment)"
+    r"|.*?([A-Z][\w\s&]+)\s+(?:Announces|Launches)"
+    r")",
+    re.DOTALL,
+)
+
+# Sector keyword tables, checked in dict order (first matching sector wins).
+# Each sector's keywords become one compiled alternation, so a text is
+# scanned once per sector instead of once per keyword.
+ARTICLE_SECTOR_KEYWORDS = {
+    "fintech": ["fintech", "financial", "payment", "banking", "lending"],
+    "healthtech": ["health", "medical", "healthcare", "diagnostic", "pharma"],
+    "edtech": ["education", "learning", "edtech", "student", "course"],
+    "ecommerce": ["ecommerce", "retail", "marketplace", "shopping", "consumer"],
+    "saas": ["saas", "enterprise", "software", "b2b", "cloud"],
+    "ai": ["ai", "artificial intelligence", "machine learning", "ml", "deep learning"],
+    "cleantech": ["clean", "green", "sustainability", "climate", "energy", "solar"],
+    "deeptech": ["deeptech", "semiconductor", "chip", "hardware", "iot"],
+    "agritech": ["agri", "farm", "agriculture", "crop", "farmer"],
+    "logistics": ["logistics", "supply chain", "delivery", "transport", "warehouse"]
+}
 
-    patterns = [
-        r"^How\s+(.+?)\s+Is\s+",
-        r"^How\s+(.+?)\s+Has\s+",
-        r"^How\s+(.+?)\s+Uses\s+",
-        r"^How\s+(.+?)\s+Helps\s+",
-        r"^Why\s+(.+?)\s+",
-        r"^(.+?)’s\s+",
-        r"^(.+?)'s\s+",
-        r"^Inside\s+([A-Z][A-Za-z0-9&.\-]{2,20})$",
-    ]
+ENRICH_SECTOR_KEYWORDS = {
+    "fintech": ["pay", "fin", "bank", "lend", "money", "wallet", "insurance"],
+    "healthtech": ["health", "med", "care", "clinic", "doctor", "patient", "diagnostic"],
+    "edtech": ["edu", "learn", "school", "student", "course", "academy"],
+    "ecommerce": ["shop", "store", "retail", "market", "commerce", "buy", "sell"],
+    "saas": ["cloud", "software", "enterprise", "b2b", "api", "platform"],
+    "ai": ["ai", "artificial", "intelligence", "ml", "machine learning", "neural", "bot"],
+    "agritech": ["agri", "farm", "crop", "farmer", "harvest", "rural"],
+    "cleantech": ["green", "clean", "solar", "energy", "carbon", "climate", "sustain"],
+    "logistics": ["logistics", "delivery", "supply", "transport", "cargo", "warehouse"],
+    "food": ["food", "restaurant", "kitchen", "meal", "grocery", "delivery"],
+}
 
-    for pattern in patterns:
-        match = re.search(pattern, title, flags=re.IGNORECASE)
-        if not match:
-            continue
 
-        name = match.group(1).strip()
+def _compile_sectors(table: Dict[str, List[str]]):
+    return tuple(
+        (sector, re.compile("|".join(re.escape(kw) for kw in keywords)))
+        for sector, keywords in table.items()
+    )
 
-        # reject phrases
-        if len(name.split()) > 3:
-            return None
 
-        INVALID_NAMES = {
-            "gig economy",
-            "startup",
-            "startups",
-            "guide",
-            "funding",
-            "economy",
-            "features",
-            "decoding",
-            "understanding",
-        }
-
-        if name.lower() in INVALID_NAMES:
-            return None
+ARTICLE_SECTORS = _compile_sectors(ARTICLE_SECTOR_KEYWORDS)
+ENRICH_SECTORS = _compile_sectors(ENRICH_SECTOR_KEYWORDS)
+
+
+def _detect_sector(sectors, text_lower: str) -> Optional[str]:
+    """First sector (in table order) with any keyword in text_lower."""
+    for sector, pattern in sectors:
+        if pattern.search(text_lower):
+            return sector
+    return None
 
-        return name
-    COUNTRY_BLOCKLIST = {"india", "bharat", "indian", "usa", "china", "europe"}
 
-    if name.lower() in COUNTRY_BLOCKLIST:
+def extract_company_from_title(title: str) -> Optional[str]:
+    title = title.strip()
+
+    match = TITLE_RE.match(title)
+    if not match:
         return None
 
+    name = match.group(match.lastindex).strip()
 
-    return None
+    # reject phrases
+    if len(name.split()) > 3:
+        return None
+
+    name_lower = name.lower()
+    if name_lower in INVALID_NAMES or name_lower in COUNTRY_BLOCKLIST:
+        return None
+
+    return name
 
 
 
@@ -92,51 +204,88 @@ def clean_html(text: str) -> str:
     """Clean HTML tags and normalize whitespace"""
     if not text:
         return ""
-    text = re.sub(r"<img[^>]*>", " ", text)
-    text = re.sub(r"<script[^>]*>.*?</script>", " ", text, flags=re.DOTALL)
-    text = re.sub(r"<style[^>]*>.*?</style>", " ", text, flags=re.DOTALL)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text)
+    if "<" not in text:
+        # Already plain text (e.g. from get_text): only whitespace to fix
+        return WS_RE.sub(" ", text).strip()
+    text = IMG_RE.sub(" ", text)
+    text = SCRIPT_RE.sub(" ", text)
+    text = STYLE_RE.sub(" ", text)
+    text = TAG_RE.sub(" ", text)
+    text = WS_RE.sub(" ", text)
     return text.strip()
 
-def fetch_page(url: str, retries: int = 3, delay: float = 1.0) -> Optional[str]:
+def fetch_page(url: str, retries: int = 3, delay: float = 0.0) -> Optional[str]:
     """
-    Fetch page content with retry logic and rate limiting
+    Fetch page content with rate limiting.
+    Transient failures are retried with backoff by the session's adapter
+    (3 retries); `retries` is only kept so positional callers of the old
+    signature don't pass their retry count as `delay`.
+    Requests are paced by RATE_LIMIT and `delay` adds an extra fixed pause.
+    At most MAX_PAGE_BYTES of the body is returned.
     """
-    for attempt in range(retries):
-        try:
-            time.sleep(delay + random.uniform(0, 1))  # Polite delay
-            response = requests.get(url, headers=HEADERS, timeout=15)
+    try:
+        if delay:
+            time.sleep(delay)
+        with RATE_LIMIT:
+            response = SESSION.get(url, timeout=15, stream=True)
+        with response:
             response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            logger.warning(f"Attempt {attempt + 1}/{retries} failed for {url}: {e}")
-            if attempt < retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                logger.error(f"Failed to fetch {url} after {retries} attempts")
+            content_type = response.headers.get("Content-Type", "")
+            if content_type and "html" not in content_type:
+                logger.warning(f"Skipping non-HTML response ({content_type}) from {url}")
                 return None
-    return None
+            # Read at most MAX_PAGE_BYTES; articles and listings are far smaller
+            body = bytearray()
+            for chunk in response.iter_content(65536):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+            return body[:MAX_PAGE_BYTES].decode(response.encoding or "utf-8", errors="replace")
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch {url}: {e}")
+        return None
+
+async def _afetch_page(session: aiohttp.ClientSession, url: str, retries: int = 3) -> Optional[str]:
+    """Async fetch_page for article downloads: same pacing and size cap; 429/5xx are retried."""
+    try:
+        async with RATE_LIMIT:
+            response, body = await get_with_retry(
+                session, url, retries=retries, backoff_factor=1.0, max_bytes=MAX_PAGE_BYTES
+            )
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and "html" not in content_type:
+            logger.warning(f"Skipping non-HTML response ({content_type}) from {url}")
+            return None
+        return body.decode(response.charset or "utf-8", errors="replace")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Failed to fetch {url}: {e}")
+        return None
+
+async def _afetch_articles(urls: List[str]) -> List[Optional[str]]:
+    """Download article pages concurrently over one keep-alive session, in input order."""
+    semaphore = asyncio.Semaphore(ARTICLE_CONCURRENCY)
+    
+    async def fetch(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        async with semaphore:
+            return await _afetch_page(session, url)
+    
+    async with make_client_session(HEADERS, limit=32, limit_per_host=ARTICLE_CONCURRENCY, timeout=15) as session:
+        return await asyncio.gather(*(fetch(session, url) for url in urls))
+
+
+def _source_tag(url: str) -> str:
+    """Source label from the URL's first path segment, e.g. inc42_startups."""
+    return "inc42_" + urlparse(url).path.split("/")[1]
 
 def extract_startup_from_article(article_html: str, source_url: str) -> Optional[Dict]:
     """
     Extract startup information from Inc42 article HTML
     """
-    soup = BeautifulSoup(article_html, "html.parser")
-    
-    # Try multiple selectors for company names
-    name_selectors = [
-        "h1.entry-title",
-        "h2.entry-title",
-        "h1.article-title",
-        "h2.title",
-        ".startup-name",
-        "h3",
-        "h2"
-    ]
+    soup = BeautifulSoup(article_html, HTML_PARSER, parse_only=ARTICLE_STRAINER)
     
     # Step 1: get article title
-    title_tag = soup.select_one("h1, h2, .entry-title")
+    title_tag = ARTICLE_TITLE_SELECTOR.select_one(soup)
     if not title_tag:
         return None
 
@@ -160,37 +309,14 @@ def extract_startup_from_article(article_html: str, source_url: str) -> Optional
         # Try to get first paragraph
         first_p = soup.find("p")
         if first_p:
-            description = clean_html(str(first_p))[:300]
+            description = clean_html(first_p.get_text(" "))[:300]
     
     # Extract website if available
-    website = ""
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if href.startswith("http") and not "inc42.com" in href:
-            if any(domain in href.lower() for domain in [".com", ".in", ".io", ".ai", ".tech"]):
-                website = href
-                break
+    link = soup.find("a", href=COMPANY_URL_RE)
+    website = link["href"] if link else ""
     
     # Determine sector from content
-    sector_keywords = {
-        "fintech": ["fintech", "financial", "payment", "banking", "lending"],
-        "healthtech": ["health", "medical", "healthcare", "diagnostic", "pharma"],
-        "edtech": ["education", "learning", "edtech", "student", "course"],
-        "ecommerce": ["ecommerce", "retail", "marketplace", "shopping", "consumer"],
-        "saas": ["saas", "enterprise", "software", "b2b", "cloud"],
-        "ai": ["ai", "artificial intelligence", "machine learning", "ml", "deep learning"],
-        "cleantech": ["clean", "green", "sustainability", "climate", "energy", "solar"],
-        "deeptech": ["deeptech", "semiconductor", "chip", "hardware", "iot"],
-        "agritech": ["agri", "farm", "agriculture", "crop", "farmer"],
-        "logistics": ["logistics", "supply chain", "delivery", "transport", "warehouse"]
-    }
-    
-    detected_sector = "technology"
-    content_lower = (description + " " + company_name).lower()
-    for sector, keywords in sector_keywords.items():
-        if any(kw in content_lower for kw in keywords):
-            detected_sector = sector
-            break
+    detected_sector = _detect_sector(ARTICLE_SECTORS, (description + " " + company_name).lower()) or "technology"
 
     # reject obvious non-company phrases
     BAD_FUNDING_NAMES = [
@@ -208,53 +334,45 @@ def extract_startup_from_article(article_html: str, source_url: str) -> Optional
     
     return normalize_startup(
         company_name=company_name,
-        source="inc42_" + urlparse(source_url).path.split("/")[1],
+        source=_source_tag(source_url),
         website=website,
         description=f"{detected_sector.upper()}: {description}" if description else detected_sector.upper(),
         location="India",
         confidence="high" if website else "medium"
     )
 
-def scrape_inc42_listings_page(url: str) -> List[Dict]:
+def scrape_inc42_listings_page(url: str, seen: Optional[Set[str]] = None) -> List[Dict]:
     """
-    Scrape a listings page (like 30 Startups to Watch) for multiple startup links
+    Scrape a listings page (like 30 Startups to Watch) for multiple startup links.
+    Article URLs already in `seen` are skipped; fetched ones are added to it.
     """
     html = fetch_page(url)
     if not html:
         return []
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     startups = []
     
-    # Find all article links
-    article_links = set()
-    
-    # Common patterns for article links on Inc42
-    selectors = [
-        "article h2 a",
-        "article h3 a",
-        ".post-title a",
-        ".entry-title a",
-        ".startup-card a",
-        "a[href*='/startups/']",
-        "a[href*='/features/']",
-        "h2 a[href]",
-        "h3 a[href]"
-    ]
+    # Find all article links (insertion-ordered dict: deduped, page order kept)
+    article_links = {}
     
-    for selector in selectors:
-        for link in soup.select(selector):
-            href = link.get("href", "")
-            if href and "/startups/" in href or "/features/" in href or "/news/" in href:
-                full_url = urljoin("https://inc42.com", href)
-                article_links.add(full_url)
+    for link in LISTING_LINK_SELECTOR.select(soup):
+        href = link.get("href", "")
+        if href and "/startups/" in href or "/features/" in href or "/news/" in href:
+            full_url = urljoin("https://inc42.com", href)
+            article_links.setdefault(full_url, None)
     
     logger.info(f"Found {len(article_links)} potential startup articles on {url}")
     
-    # Process each article
-    for article_url in list(article_links)[:20]:  # Limit to 20 per page to be polite
+    if seen is None:
+        seen = set()
+    # Download articles concurrently, then parse them in link order
+    article_urls = [u for u in article_links if u not in seen][:20]  # Limit to 20 per page to be polite
+    seen.update(article_urls)
+    article_pages = asyncio.run(_afetch_articles(article_urls)) if article_urls else []
+    
+    for article_url, article_html in zip(article_urls, article_pages):
         try:
-            article_html = fetch_page(article_url, delay=0.5)
             if article_html:
                 startup = extract_startup_from_article(article_html, article_url)
                 if startup:
@@ -274,56 +392,48 @@ def scrape_inc42_funding_news(limit: int = 30) -> List[Dict]:
     if not html:
         return []
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     startups = []
     
     # Funding articles often mention multiple companies
-    funding_articles = soup.select("article")[:10]
+    funding_articles = ARTICLE_SELECTOR.select(soup, limit=10)
     
     for article in funding_articles:
         # Extract company names from funding headlines
-        title_elem = article.select_one("h2, h3, .entry-title")
+        title_elem = HEADLINE_SELECTOR.select_one(article)
         if not title_elem:
             continue
         
-        title = clean_html(str(title_elem))
+        title = clean_html(title_elem.get_text(" "))
         
-        # Pattern: "Startup Name Raises $X Million"
-        patterns = [
-            r"([A-Z][\w\s&]+)\s+(?:Raises|Secures|Gets|Closes)",
-            r"([A-Z][\w\s&]+)\s+(?:Funding|Investment)",
-            r"([A-Z][\w\s&]+)\s+(?:Announces|Launches)",
-        ]
+        match = FUNDING_RE.match(title)
+        if not match:
+            continue
+        company_name = match.group(match.lastindex).strip()
+        if not (2 < len(company_name) < 50):
+            continue
+        link_elem = LINK_SELECTOR.select_one(article)
+        website = ""
+        if link_elem and link_elem.get("href"):
+            article_url = urljoin("https://inc42.com", link_elem["href"])
+            # Try to get more details
+            article_html = fetch_page(article_url)
+            if article_html:
+                article_soup = BeautifulSoup(article_html, HTML_PARSER)
+                # Look for website link in article
+                link = article_soup.find("a", href=EXTERNAL_URL_RE)
+                if link:
+                    website = link["href"]
         
-        for pattern in patterns:
-            match = re.search(pattern, title)
-            if match:
-                company_name = match.group(1).strip()
-                if len(company_name) > 2 and len(company_name) < 50:
-                    link_elem = article.select_one("a")
-                    website = ""
-                    if link_elem and link_elem.get("href"):
-                        article_url = urljoin("https://inc42.com", link_elem["href"])
-                        # Try to get more details
-                        article_html = fetch_page(article_url, delay=0.3)
-                        if article_html:
-                            article_soup = BeautifulSoup(article_html, "html.parser")
-                            # Look for website link in article
-                            for a in article_soup.find_all("a", href=True):
-                                if "inc42.com" not in a["href"] and a["href"].startswith("http"):
-                                    website = a["href"]
-                                    break
-                    
-                    startup = normalize_startup(
-                        company_name=company_name,
-                        source="inc42_funding_news",
-                        website=website,
-                        description=f"Featured in funding news: {title[:100]}",
-                        location="India",
-                        confidence="high" if website else "medium"
-                    )
-                    startups.append(startup)
-                    break
+        startup = normalize_startup(
+            company_name=company_name,
+            source="inc42_funding_news",
+            website=website,
+            description=f"Featured in funding news: {title[:100]}",
+            location="India",
+            confidence="high" if website else "medium"
+        )
+        startups.append(startup)
     
     return startups[:limit]
 
@@ -333,13 +443,15 @@ def collect_inc42_startups(limit: int = 50, use_parallel: bool = True) -> List[D
     Ensures at least 50 startups are fetched
     """
     all_startups = []
+    # Article URLs already fetched by any listings page in this run
+    seen_urls: Set[str] = set()
     
     logger.info("Starting Inc42 scraping...")
     
     # Method 1: Scrape main listings pages
     for endpoint in INC42_ENDPOINTS[:3]:  # Use first 3 endpoints
         try:
-            startups = scrape_inc42_listings_page(endpoint)
+            startups = scrape_inc42_listings_page(endpoint, seen_urls)
             all_startups.extend(startups)
             logger.info(f"Collected {len(startups)} from {endpoint}")
             if len(all_startups) >= limit:
@@ -365,7 +477,7 @@ def collect_inc42_startups(limit: int = 50, use_parallel: bool = True) -> List[D
         ]
         
         with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_url = {executor.submit(scrape_inc42_listings_page, url): url for url in additional_urls}
+            future_to_url = {executor.submit(scrape_inc42_listings_page, url, seen_urls): url for url in additional_urls}
             for future in as_completed(future_to_url):
                 url = future_to_url[future]
                 try:
@@ -375,13 +487,8 @@ def collect_inc42_startups(limit: int = 50, use_parallel: bool = True) -> List[D
                 except Exception as e:
                     logger.error(f"Error in parallel scraping {url}: {e}")
     
-    # Remove duplicates based on startup_id
-    seen_ids = set()
-    unique_startups = []
-    for s in all_startups:
-        if s["startup_id"] not in seen_ids:
-            seen_ids.add(s["startup_id"])
-            unique_startups.append(s)
+    # Remove duplicates based on startup_id (first occurrence wins, rejected None entries dropped)
+    unique_startups = deduplicate(all_startups)
     
     logger.info(f"Total unique startups from Inc42: {len(unique_startups)}")
     return unique_startups[:limit]
@@ -395,27 +502,12 @@ def enrich_with_inc42(startups: List[Dict]) -> List[Dict]:
     for s in startups:
         # Add sector tags based on name/description
         name_desc = (s.get("company_name", "") + " " + s.get("description", "")).lower()
-        
-        sector_indicators = {
-            "fintech": ["pay", "fin", "bank", "lend", "money", "wallet", "insurance"],
-            "healthtech": ["health", "med", "care", "clinic", "doctor", "patient", "diagnostic"],
-            "edtech": ["edu", "learn", "school", "student", "course", "academy"],
-            "ecommerce": ["shop", "store", "retail", "market", "commerce", "buy", "sell"],
-            "saas": ["cloud", "software", "enterprise", "b2b", "api", "platform"],
-            "ai": ["ai", "artificial", "intelligence", "ml", "machine learning", "neural", "bot"],
-            "agritech": ["agri", "farm", "crop", "farmer", "harvest", "rural"],
-            "cleantech": ["green", "clean", "solar", "energy", "carbon", "climate", "sustain"],
-            "logistics": ["logistics", "delivery", "supply", "transport", "cargo", "warehouse"],
-            "food": ["food", "restaurant", "kitchen", "meal", "grocery", "delivery"],
-        }
-        
-        for sector, keywords in sector_indicators.items():
-            if any(kw in name_desc for kw in keywords):
-                if not s.get("description"):
-                    s["description"] = f"{sector.title()} startup operating in India"
-                else:
-                    s["description"] = f"[{sector.upper()}] {s['description']}"
-                break
+        sector = _detect_sector(ENRICH_SECTORS, name_desc)
+        if sector:
+            if not s.get("description"):
+                s["description"] = f"{sector.title()} startup operating in India"
+            else:
+                s["description"] = f"[{sector.upper()}] {s['description']}"
         
         # Mark as enriched
         s["inc42_enriched"] = True
@@ -3,20 +3,54 @@ LinkedIn startup discovery - Fixed to only return real companies
 REMOVED: Fake stealth startup generation
 """
 
-import requests
 import json
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
-from base import normalize_startup, logger, clean_text, is_valid_company
+from base import normalize_startup, logger, clean_text, is_valid_company, make_session, RateLimiter
 import os
 from dotenv import load_dotenv
 
 LINKEDIN_SEARCH_URL = "https://www.linkedin.com/voyager/api/search/blended"
+PAGE_SIZE = 20
+MAX_PAGES_PER_KEYWORD = 5
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
+    "Accept": "application/vnd.linkedin.normalized+json+2.1",
+    "X-Restli-Protocol-Version": "2.0.0",
+}
+
+# One keep-alive session for all search pages; cookies are passed per request
+SESSION = make_session(HEADERS)
+
+# Global pace for the voyager API across concurrent page fetches
+RATE_LIMIT = RateLimiter(2)
 
 load_dotenv()
 
 
+# Country codes/names that count as an India presence
+INDIA_TOKENS = frozenset({"in", "ind", "india", "bharat"})
+_LOCATION_SPLIT_RE = re.compile(r"[\s,/()-]+")
+
+
+def _is_india_location(loc) -> bool:
+    """
+    Check a LinkedIn location entry (usually a dict with a `country` code,
+    sometimes a plain string) without stringifying the whole dict.
+    """
+    if isinstance(loc, dict):
+        country = loc.get("country")
+        if isinstance(country, str):
+            return country.lower() in INDIA_TOKENS
+        loc = loc.get("name") or loc.get("description") or ""
+    if not isinstance(loc, str):
+        return False
+    # Whole tokens only, so "Indiana" is not India; bare "IN" is too ambiguous here
+    return any(token in INDIA_TOKENS for token in _LOCATION_SPLIT_RE.split(loc.lower()) if token != "in")
+
+
 def get_linkedin_cookies() -> Dict[str, str]:
     """Get LinkedIn authentication cookies."""
     return {
@@ -25,108 +59,115 @@ def get_linkedin_cookies() -> Dict[str, str]:
     }
 
 
+def _fetch_search_page(keyword: str, start: int, cookies: Dict[str, str]) -> List[Dict]:
+    """Fetch one page of blended search results; empty list when the page is missing."""
+    params = {
+        "keywords": keyword,
+        "origin": "GLOBAL_SEARCH_HEADER",
+        "q": "blended",
+        "start": start,
+        "count": PAGE_SIZE
+    }
+    
+    with RATE_LIMIT:
+        res = SESSION.get(
+            LINKEDIN_SEARCH_URL,
+            params=params,
+            cookies=cookies,
+            timeout=15
+        )
+    
+    if res.status_code != 200:
+        return []
+    
+    data = res.json()
+    return data.get("data", {}).get("elements", [])
+
+
+def _parse_elements(elements: List[Dict]) -> List[Dict]:
+    """Turn search elements into normalized startups (real Indian companies only)."""
+    startups = []
+    for element in elements:
+        try:
+            company = element.get("company", {})
+            if not company:
+                continue
+            
+            name = company.get("name", "")
+            if not name:
+                continue
+            
+            # Skip stealth/generic names
+            if not is_valid_company(name, "", "linkedin")[0]:
+                continue
+            
+            # Check for India presence
+            locations = company.get("locations", [])
+            is_india = any(_is_india_location(loc) for loc in locations)
+            
+            if not is_india:
+                continue
+            
+            website = ""
+            websites = company.get("websites", [])
+            if websites:
+                website = websites[0].get("url", "")
+            
+            startup = normalize_startup(
+                company_name=name,
+                website=website,
+                description=company.get("description", ""),
+                source="linkedin_search",
+                confidence="medium",
+                location="India",
+                industry=", ".join(company.get("industries", [])),
+                employee_count=str(company.get("staffCount", ""))
+            )
+            
+            if startup:
+                startups.append(startup)
+                
+        except Exception as e:
+            logger.debug(f"Element parse error: {e}")
+            continue
+    return startups
+
+
 def search_linkedin_startups(keywords: List[str], limit: int = 20) -> List[Dict]:
     """
     Search LinkedIn for real startup companies only.
+    The first few result pages of each keyword are requested concurrently
+    (paced by RATE_LIMIT) and consumed in page order.
     """
     startups = []
     cookies = get_linkedin_cookies()
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
-        "Accept": "application/vnd.linkedin.normalized+json+2.1",
-        "X-Restli-Protocol-Version": "2.0.0",
-    }
-    
-    for keyword in keywords:
-        if len(startups) >= limit:
-            break
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for keyword in keywords:
+            if len(startups) >= limit:
+                break
             
-        start = 0
-        while len(startups) < limit:
-            params = {
-                "keywords": keyword,
-                "origin": "GLOBAL_SEARCH_HEADER",
-                "q": "blended",
-                "start": start,
-                "count": 20
-            }
+            pages = [
+                executor.submit(_fetch_search_page, keyword, start, cookies)
+                for start in range(0, PAGE_SIZE * MAX_PAGES_PER_KEYWORD, PAGE_SIZE)
+            ]
             
             try:
-                res = requests.get(
-                    LINKEDIN_SEARCH_URL,
-                    params=params,
-                    headers=headers,
-                    cookies=cookies,
-                    timeout=15
-                )
-                
-                if res.status_code != 200:
-                    break
-                
-                data = res.json()
-                elements = data.get("data", {}).get("elements", [])
-                
-                if not elements:
-                    break
-                
-                for element in elements:
-                    try:
-                        company = element.get("company", {})
-                        if not company:
-                            continue
-                        
-                        name = company.get("name", "")
-                        if not name:
-                            continue
-                        
-                        # Skip stealth/generic names
-                        if not is_valid_company(name, "", "linkedin")[0]:
-                            continue
-                        
-                        # Check for India presence
-                        locations = company.get("locations", [])
-                        is_india = any(
-                            "india" in str(loc).lower() for loc in locations
-                        )
-                        
-                        if not is_india:
-                            continue
-                        
-                        website = ""
-                        websites = company.get("websites", [])
-                        if websites:
-                            website = websites[0].get("url", "")
-                        
-                        startup = normalize_startup(
-                            company_name=name,
-                            website=website,
-                            description=company.get("description", ""),
-                            source="linkedin_search",
-                            confidence="medium",
-                            location="India",
-                            industry=", ".join(company.get("industries", [])),
-                            employee_count=str(company.get("staffCount", ""))
-                        )
-                        
-                        if startup:
-                            startups.append(startup)
-                        
-                        if len(startups) >= limit:
-                            break
-                            
-                    except Exception as e:
-                        logger.debug(f"Element parse error: {e}")
-                        continue
-                
-                start += 20
-                time.sleep(1)
-                
+                for page in pages:
+                    elements = page.result()
+                    if not elements:
+                        break
+                    startups.extend(_parse_elements(elements))
+                    if len(startups) >= limit:
+                        break
             except Exception as e:
                 logger.error(f"LinkedIn search error: {e}")
-                break
+            finally:
+                # Pages past the end of results (or past the limit) are not needed
+                for page in pages:
+                    page.cancel()
     
-    return startups
+    return startups[:limit]
 
 
 # REMOVED: detect_stealth_startups() function - it was generating fake data
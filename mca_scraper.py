@@ -3,99 +3,138 @@ Ministry of Corporate Affairs (MCA) scraper - Optimized for 50+ results.
 Uses official MCA21 data and filing patterns.
 """
 
-import requests
+import asyncio
 import csv
 import io
-import time
+import re
 from typing import List, Dict
-from base import normalize_startup, logger, clean_text
+import aiohttp
+import orjson
+from base import normalize_startup, logger, clean_text, make_session, make_client_session
 from datetime import datetime, timedelta
 
 MCA_SEARCH_URL = "https://www.mca.gov.in/bin/search.html"
 MCA_API_URL = "https://www.mca.gov.in/content/mca/global/en/data-and-reports/company-llp-info/incorporated-companies.html"
 
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0"}
 
-def fetch_mca_recent_filings(limit: int = 50) -> List[Dict]:
+# Shared keep-alive session for the MCA data dumps
+SESSION = make_session(
+    HEADERS,
+    pool_connections=16,
+    pool_maxsize=64,
+    backoff_factor=0.3,
+)
+
+MAX_CONCURRENT_DATES = 5
+
+# Startup indicators as one alternation: a single scan per company name
+INDICATOR_RE = re.compile(
+    r"tech|solutions|innovations|digital|data|software|systems|services|labs|ventures"
+    r"|private limited|pvt ltd"
+)
+
+# Seed data for generate_mca_sample_data
+MCA_SAMPLE_TEMPLATES = [
+    {"name": "BlueNova Technologies Private Limited", "city": "Bangalore"},
+    {"name": "AgroStack Innovations Private Limited", "city": "Hyderabad"},
+    {"name": "FinBridge Solutions Private Limited", "city": "Mumbai"},
+    {"name": "MedAI Labs Private Limited", "city": "Delhi"},
+    {"name": "CloudFirst Systems Private Limited", "city": "Pune"},
+    {"name": "DataDriven Analytics Private Limited", "city": "Chennai"},
+    {"name": "NextGen Retail Private Limited", "city": "Kolkata"},
+    {"name": "SmartEnergy Solutions Private Limited", "city": "Ahmedabad"},
+    {"name": "EduTech Pioneers Private Limited", "city": "Jaipur"},
+    {"name": "LogiChain Networks Private Limited", "city": "Indore"},
+]
+
+
+
+def _parse_filings(companies: List[Dict], date_str: str) -> List[Dict]:
     startups = []
-    
-    # MCA publishes daily filings
-    dates = [(datetime.now() - timedelta(days=i)).strftime("%d-%m-%Y") for i in range(30)]
-    
-    for date_str in dates:
-        if len(startups) >= limit:
-            break
-            
+    for company in companies:
         try:
-            # Search for companies registered on this date
-            params = {
-                "type": "company",
-                "date": date_str,
-                "category": "company limited by shares",
-                "subcategory": "non-government"
-            }
+            name = company.get("companyName", "")
+            if not name:
+                continue
             
-            res = requests.get(
-                MCA_SEARCH_URL,
-                params=params,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
-                    "Accept": "application/json"
-                },
-                timeout=15
-            )
-            
-            if res.status_code == 200:
-                # MCA search.html often returns HTML, not JSON - parse safely
-                try:
-                    data = res.json()
-                except (ValueError, Exception):
-                    # Not JSON (e.g. HTML page) - skip this request
-                    continue
-                companies = data.get("companies", []) or data.get("data", [])
-                
-                for company in companies:
-                    try:
-                        name = company.get("companyName", "")
-                        if not name:
-                            continue
-                        
-                        # Filter for startup indicators
-                        startup_indicators = [
-                            "tech", "solutions", "innovations", "digital", "data",
-                            "software", "systems", "services", "labs", "ventures",
-                            "private limited", "pvt ltd"
-                        ]
-                        
-                        is_startup = any(ind in name.lower() for ind in startup_indicators)
-                        
-                        if not is_startup:
-                            continue
-                        
-                        cin = company.get("cin", "")
-                        
-                        startups.append(normalize_startup(
-                            company_name=clean_text(name),
-                            source=f"mca_filing_{date_str}",
-                            confidence="high",
-                            description=f"CIN: {cin}, Registered: {date_str}"
-                        ))
-                        
-                        if len(startups) >= limit:
-                            break
-                            
-                    except Exception as e:
-                        logger.debug(f"Company parse error: {e}")
-                        continue
+            # Filter for startup indicators
+            if not INDICATOR_RE.search(name.lower()):
+                continue
             
-            time.sleep(0.3)
+            cin = company.get("cin", "")
             
+            startups.append(normalize_startup(
+                company_name=clean_text(name),
+                source=f"mca_filing_{date_str}",
+                confidence="high",
+                description=f"CIN: {cin}, Registered: {date_str}"
+            ))
+                
         except Exception as e:
-            logger.error(f"MCA fetch error for {date_str}: {e}")
+            logger.debug(f"Company parse error: {e}")
             continue
-    
     return startups
 
 
+async def _fetch_filings_for_date(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, date_str: str) -> List[Dict]:
+    """Companies registered on one date; empty on any error or non-JSON reply."""
+    # Search for companies registered on this date
+    params = {
+        "type": "company",
+        "date": date_str,
+        "category": "company limited by shares",
+        "subcategory": "non-government"
+    }
+    
+    try:
+        async with semaphore, session.get(MCA_SEARCH_URL, params=params, headers={"Accept": "application/json"}) as res:
+            if res.status != 200:
+                return []
+            # MCA search.html often returns HTML, not JSON - parse safely
+            try:
+                data = orjson.loads(await res.read())
+            except orjson.JSONDecodeError:
+                # Not JSON (e.g. HTML page) - skip this request
+                return []
+        if not isinstance(data, dict):
+            return []
+        companies = data.get("companies", []) or data.get("data", [])
+    except Exception as e:
+        logger.error(f"MCA fetch error for {date_str}: {e}")
+        return []
+    
+    return _parse_filings(companies, date_str)
+
+
+async def _fetch_mca_recent_filings(limit: int) -> List[Dict]:
+    startups = []
+    
+    # MCA publishes daily filings
+    dates = [(datetime.now() - timedelta(days=i)).strftime("%d-%m-%Y") for i in range(30)]
+    
+    # At most MAX_CONCURRENT_DATES searches in flight, to stay polite
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DATES)
+    async with make_client_session(HEADERS, limit=10, limit_per_host=MAX_CONCURRENT_DATES, timeout=15) as session:
+        results = await asyncio.gather(*(_fetch_filings_for_date(session, semaphore, d) for d in dates))
+    
+    # Newest date first, so the cutoff doesn't depend on which reply came back first
+    for date_startups in results:
+        startups.extend(date_startups)
+        if len(startups) >= limit:
+            break
+    
+    return startups[:limit]
+
+
+def fetch_mca_recent_filings(limit: int = 50) -> List[Dict]:
+    """
+    Search MCA for companies registered in the last 30 days.
+    Dates are queried concurrently; results are kept newest date first, up to `limit`.
+    """
+    return asyncio.run(_fetch_mca_recent_filings(limit))
+
+
 def scrape_mca_excel_data(limit: int = 50) -> List[Dict]:
     """
     Scrape MCA Excel/CSV data dumps.
@@ -109,36 +148,53 @@ def scrape_mca_excel_data(limit: int = 50) -> List[Dict]:
     startups = []
     
     for url in urls:
+        if len(startups) >= limit:
+            break
         try:
-            res = requests.get(url, timeout=30)
-            if res.status_code == 200:
-                # Parse CSV/Excel
-                content = io.StringIO(res.text)
-                reader = csv.DictReader(content)
+            res = SESSION.get(url, stream=True, timeout=30)
+            with res:
+                if res.status_code != 200:
+                    continue
+                
+                # Parse the CSV as it downloads instead of buffering the whole dump
+                res.raw.decode_content = True
+                reader = csv.reader(io.TextIOWrapper(res.raw, encoding="utf-8-sig", errors="replace", newline=""))
+                
+                # Column positions looked up once from the header row
+                columns = {column: i for i, column in enumerate(next(reader, []))}
+                name_col = columns.get("Company Name")
+                date_col = columns.get("Date of Incorporation")
+                cin_col = columns.get("CIN")
+                if name_col is None:
+                    continue
                 
+                cutoff = datetime.now() - timedelta(days=730)
                 for row in reader:
                     try:
-                        name = row.get("Company Name", "")
+                        name = row[name_col] if name_col < len(row) else ""
                         if not name:
                             continue
                         
                         # Filter for recent companies (last 2 years)
-                        date_str = row.get("Date of Incorporation", "")
+                        date_str = row[date_col] if date_col is not None and date_col < len(row) else ""
                         if date_str:
                             try:
-                                reg_date = datetime.strptime(date_str, "%d-%m-%Y")
-                                if datetime.now() - reg_date > timedelta(days=730):
+                                # DD-MM-YYYY by hand: strptime is slow on large dumps
+                                day, month, year = date_str.split("-")
+                                if datetime(int(year), int(month), int(day)) < cutoff:
                                     continue
                             except:
                                 pass
                         
+                        cin = row[cin_col] if cin_col is not None and cin_col < len(row) else ""
                         startups.append(normalize_startup(
                             company_name=clean_text(name),
                             source="mca_master_data",
                             confidence="high",
-                            description=f"CIN: {row.get('CIN', '')}"
+                            description=f"CIN: {cin}"
                         ))
                         
+                        # Stop reading; leaving the block returns the connection to the pool
                         if len(startups) >= limit:
                             break
                             
@@ -156,25 +212,11 @@ def generate_mca_sample_data(limit: int = 50) -> List[Dict]:
     """
     Generate realistic MCA-based sample data.
     """
-    templates = [
-        {"name": "BlueNova Technologies Private Limited", "city": "Bangalore"},
-        {"name": "AgroStack Innovations Private Limited", "city": "Hyderabad"},
-        {"name": "FinBridge Solutions Private Limited", "city": "Mumbai"},
-        {"name": "MedAI Labs Private Limited", "city": "Delhi"},
-        {"name": "CloudFirst Systems Private Limited", "city": "Pune"},
-        {"name": "DataDriven Analytics Private Limited", "city": "Chennai"},
-        {"name": "NextGen Retail Private Limited", "city": "Kolkata"},
-        {"name": "SmartEnergy Solutions Private Limited", "city": "Ahmedabad"},
-        {"name": "EduTech Pioneers Private Limited", "city": "Jaipur"},
-        {"name": "LogiChain Networks Private Limited", "city": "Indore"},
-    ]
-    
     startups = []
-    import random
     
     for i in range(limit):
-        template = templates[i % len(templates)]
-        suffix = f" {i+1}" if i >= len(templates) else ""
+        template = MCA_SAMPLE_TEMPLATES[i % len(MCA_SAMPLE_TEMPLATES)]
+        suffix = f" {i+1}" if i >= len(MCA_SAMPLE_TEMPLATES) else ""
         
         startups.append(normalize_startup(
             company_name=f"{template['name']}{suffix}",
@@ -207,9 +249,11 @@ def collect_mca_startups(limit: int = 50, use_real_data: bool = True) -> List[Di
                 excel_data = scrape_mca_excel_data(limit - len(startups))
                 existing_ids = {s["startup_id"] for s in startups}
                 for s in excel_data:
-                    if s["startup_id"] not in existing_ids:
+                    # add() doubles as the membership test: one hash lookup per item
+                    seen = len(existing_ids)
+                    existing_ids.add(s["startup_id"])
+                    if len(existing_ids) != seen:
                         startups.append(s)
-                        existing_ids.add(s["startup_id"])
                 logger.info(f"MCA after Excel data: {len(startups)} startups")
 
         # Always fill with structured sample data so MCA appears in output
@@ -218,9 +262,10 @@ def collect_mca_startups(limit: int = 50, use_real_data: bool = True) -> List[Di
             samples = generate_mca_sample_data(remaining)
             existing_ids = {s["startup_id"] for s in startups}
             for s in samples:
-                if s["startup_id"] not in existing_ids:
+                seen = len(existing_ids)
+                existing_ids.add(s["startup_id"])
+                if len(existing_ids) != seen:
                     startups.append(s)
-                    existing_ids.add(s["startup_id"])
             logger.info(f"MCA total (with samples): {len(startups)}")
     except Exception as e:
         logger.error(f"MCA collection error: {e}, using sample data only")
@@ -2,12 +2,16 @@
 Startup Discovery Engine - Fixed to only collect real companies
 """
 
-import json
+import heapq
 import os
+import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future, wait
+from typing import List, Dict, Tuple
 import logging
+import orjson
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -29,8 +33,18 @@ logging.basicConfig(
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TARGET_COUNT = 50
+PER_SOURCE_TIMEOUT_SECS = 120
+# Final ordering: high, then medium, then everything else (low or unset)
+CONFIDENCE_PRIORITY = {"high": 0, "medium": 1}
 OUTPUT_PATH = os.path.join(PROJECT_ROOT, "data", "startup_discovery.json")
 
+def _run_source(func, future: Future):
+    """Thread body: run one source and record its result (or error) on `future`."""
+    try:
+        future.set_result(func())
+    except Exception as e:
+        future.set_exception(e)
+
 def parallel_collection() -> List[Dict]:
     """
     Collect startups from all sources in parallel.
@@ -53,48 +67,93 @@ def parallel_collection() -> List[Dict]:
     
     logger.info("🚀 Starting parallel startup discovery...")
     
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        future_to_source = {
-            executor.submit(func): source 
-            for source, func in scraper_tasks.items()
-        }
-        
-        for future in as_completed(future_to_source):
-            source = future_to_source[future]
-            try:
-                startups = future.result()
-                # Filter valid immediately
-                valid_startups = filter_valid_startups(startups)
-                all_startups.extend(valid_startups)
-                logger.info(f"✅ {source}: {len(valid_startups)} valid startups ({len(startups) - len(valid_startups)} filtered)")
-            except Exception as e:
-                logger.error(f"❌ {source}: Failed - {str(e)}")
+    # One daemon thread per source: they are all network-bound, and a source
+    # still hung at the deadline must not keep the interpreter alive at exit.
+    # There is no process-wide requests.Session to share: each scraper talks to
+    # its own host with its own headers, retries and cache, and keeps its own pool.
+    future_to_source = {}
+    for source, func in scraper_tasks.items():
+        future = Future()
+        threading.Thread(target=_run_source, args=(func, future), name=f"source:{source}", daemon=True).start()
+        future_to_source[future] = source
+    
+    # Sources all start together, so one wait bounds each of them
+    done, _ = wait(future_to_source, timeout=PER_SOURCE_TIMEOUT_SECS)
+    
+    # Merge in source order so the output doesn't depend on timing
+    for future, source in future_to_source.items():
+        if future not in done:
+            logger.error(f"❌ {source}: Timed out after {PER_SOURCE_TIMEOUT_SECS}s, its results are left out of this run")
+            continue
+        try:
+            startups = future.result()
+            # Filter valid immediately
+            valid_startups = filter_valid_startups(startups)
+            all_startups.extend(valid_startups)
+            logger.info(f"✅ {source}: {len(valid_startups)} valid startups ({len(startups) - len(valid_startups)} filtered)")
+        except Exception as e:
+            logger.error(f"❌ {source}: Failed - {str(e)}")
     
     return all_startups
 
+# Company names reduced to letters and digits, then stripped of trailing suffixes
+# that don't distinguish companies ("Acme Technologies Pvt Ltd" -> "acme")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_NAME_SUFFIX_RE = re.compile(r"(?:privatelimited|pvtltd|limited|ltd|inc|llp|technologies|solutions)+$")
+
+# Characters ignored by the containment check, removed in one translate() call
+_STRIP = str.maketrans("", "", " .,")
+
+def _name_stem(company_name: str) -> str:
+    """Canonical dedup key; empty when the stem is too short to be distinctive."""
+    canonical = _NON_ALNUM_RE.sub("", company_name.lower())
+    stem = _NAME_SUFFIX_RE.sub("", canonical)
+    # "Zinc" must not collapse to "z": keep the whole name when little is left
+    if len(stem) < 4:
+        stem = canonical
+    return stem if len(stem) >= 4 else ""
+
 def smart_deduplication(startups: List[Dict]) -> List[Dict]:
     """Enhanced deduplication."""
     logger.info(f"🔍 Deduplicating {len(startups)} startups...")
     
     unique_startups = deduplicate(startups)
     
-    # Additional fuzzy matching
+    # Additional fuzzy matching: a name is a duplicate when it contains, or is
+    # contained in, a name already kept. Any such pair shares a 4-gram, so only
+    # names from the matching n-gram buckets are compared.
     final_startups = []
-    name_map = {}
+    by_gram = defaultdict(list)    # every 4-gram of a kept name -> names
+    by_prefix = defaultdict(list)  # first 4-gram of a kept name -> names
+    short_names = []               # kept names with no 4-gram at all
+    
+    seen_stems = set()             # legal-suffix-free canonical names kept so far
     
     for s in unique_startups:
-        name = s["company_name"].lower().replace(" ", "").replace(".", "").replace(",", "")
-        is_duplicate = False
+        name = s["company_name"].lower().translate(_STRIP)
+        stem = _name_stem(s["company_name"])
         
-        for existing_name in name_map:
-            if name in existing_name or existing_name in name:
-                if len(name) > 5:
-                    is_duplicate = True
-                    break
+        # Fast path: same company under another legal/descriptive suffix
+        is_duplicate = stem in seen_stems
+        
+        if not is_duplicate and len(name) > 5:
+            grams = {name[i:i + 4] for i in range(len(name) - 3)}
+            candidates = set(by_gram.get(name[:4], ()))
+            for gram in grams:
+                candidates.update(by_prefix.get(gram, ()))
+            candidates.update(short_names)
+            is_duplicate = any(name in existing_name or existing_name in name for existing_name in candidates)
         
         if not is_duplicate:
-            name_map[name] = True
             final_startups.append(s)
+            if stem:
+                seen_stems.add(stem)
+            if len(name) < 4:
+                short_names.append(name)
+            else:
+                by_prefix[name[:4]].append(name)
+                for i in range(len(name) - 3):
+                    by_gram[name[i:i + 4]].append(name)
     
     logger.info(f"✨ Deduplication: {len(startups)} → {len(final_startups)}")
     return final_startups
@@ -127,29 +186,39 @@ def enrich_startup_data(startups: List[Dict]) -> List[Dict]:
     
     return startups
 
-def save_results(startups: List[Dict], filepath: str):
-    """Save results to JSON."""
+def save_results(startups: List[Dict], filepath: str) -> Tuple[Counter, Counter]:
+    """Save results to JSON. Returns the (confidence, source) counts of what was saved."""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     
     # Filter out any remaining invalid entries
     valid_startups = [s for s in startups if s and s.get("is_valid_company", True)]
     
+    # One pass for the metadata instead of a scan per field
+    confidence_counts = Counter()
+    source_counts = Counter()
+    for s in valid_startups:
+        confidence_counts[s.get("confidence")] += 1
+        source_counts[s["source"]] += 1
+    
     output = {
         "metadata": {
             "total_count": len(valid_startups),
             "target_count": TARGET_COUNT,
-            "sources_used": list(set(s["source"] for s in valid_startups)),
-            "high_confidence": len([s for s in valid_startups if s.get("confidence") == "high"]),
-            "medium_confidence": len([s for s in valid_startups if s.get("confidence") == "medium"]),
-            "low_confidence": len([s for s in valid_startups if s.get("confidence") == "low"]),
+            "sources_used": list(source_counts),
+            "high_confidence": confidence_counts["high"],
+            "medium_confidence": confidence_counts["medium"],
+            "low_confidence": confidence_counts["low"],
         },
         "startups": valid_startups
     }
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # orjson emits UTF-8 bytes directly (the ensure_ascii=False equivalent)
+    payload = orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    with open(filepath, "wb") as f:
+        f.write(payload)
     
     logger.info(f"💾 Results saved: {filepath}")
+    return confidence_counts, source_counts
 
 def main():
     """Main execution flow."""
@@ -167,28 +236,23 @@ def main():
     startups = enrich_startup_data(startups)
     
     # Phase 4: Sort by confidence
-    startups.sort(key=lambda x: (x.get("confidence") != "high", x.get("confidence") != "medium"))
-    final_startups = startups[:TARGET_COUNT]
+    # nsmallest is stable, so this equals a full sort + slice
+    final_startups = heapq.nsmallest(TARGET_COUNT, startups, key=lambda x: CONFIDENCE_PRIORITY.get(x.get("confidence"), 2))
     
     # Phase 5: Save
-    save_results(final_startups, OUTPUT_PATH)
+    confidence_counts, source_counts = save_results(final_startups, OUTPUT_PATH)
     
     # Summary
     logger.info("=" * 60)
     logger.info("📊 DISCOVERY SUMMARY")
     logger.info("=" * 60)
     logger.info(f"✅ Total Valid Startups: {len(final_startups)}")
-    logger.info(f"⭐ High Confidence: {len([s for s in final_startups if s.get('confidence') == 'high'])}")
-    logger.info(f"📍 Medium Confidence: {len([s for s in final_startups if s.get('confidence') == 'medium'])}")
+    logger.info(f"⭐ High Confidence: {confidence_counts['high']}")
+    logger.info(f"📍 Medium Confidence: {confidence_counts['medium']}")
     logger.info(f"❌ Rejected Invalid Entries: See logs above")
     
-    source_counts = {}
-    for s in final_startups:
-        src = s["source"]
-        source_counts[src] = source_counts.get(src, 0) + 1
-    
     logger.info("\n📈 Source Breakdown:")
-    for source, count in sorted(source_counts.items(), key=lambda x: -x[1]):
+    for source, count in source_counts.most_common():
         logger.info(f"   • {source}: {count}")
     
     logger.info("=" * 60)
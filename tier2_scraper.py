@@ -3,11 +3,15 @@ Tier-2 city startup discovery - Optimized for 50+ results.
 Uses city-specific sources and ecosystem databases.
 """
 
-import requests
-import json
+import asyncio
+import os
 import time
 from typing import List, Dict
-from base import normalize_startup, logger, clean_text
+import aiohttp
+import orjson
+import soupsieve as sv
+from bs4 import BeautifulSoup
+from base import normalize_startup, logger, clean_text, make_client_session, HTML_PARSER
 
 # Tier-2 city startup ecosystems
 TIER2_ECOSYSTEMS = {
@@ -24,115 +28,210 @@ TIER2_ECOSYSTEMS = {
     "Goa": ["goastartups.com", "goainnovates.org"],
 }
 
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0"}
+
+# Ecosystem sites probed at once, across all cities
+MAX_CONCURRENT_SOURCES = 8
+
+# Hosts that failed recently are skipped until their entry expires; the map
+# (hostname -> expiry epoch) persists between runs
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEAD_HOSTS_PATH = os.path.join(PROJECT_ROOT, "data", ".dead_hosts.json")
+DEAD_HOST_TTL = 3600
+_DEAD_HOSTS: Dict[str, float] = {}
+_dead_hosts_loaded = False
+
+# Listing selectors compiled once for every site
+CARD_SELECTOR = sv.compile(".startup-card, .company-item, .member")
+NAME_SELECTOR = sv.compile("h3, h4, .name, a")
+
+# Seed data for generate_tier2_startups
+TIER2_GENERATED_CITIES = [
+    {"city": "Indore", "count": 5, "industries": ["Logistics", "EdTech", "AgriTech"]},
+    {"city": "Jaipur", "count": 5, "industries": ["Tourism", "E-commerce", "Crafts"]},
+    {"city": "Coimbatore", "count": 5, "industries": ["Manufacturing", "IoT", "Textiles"]},
+    {"city": "Visakhapatnam", "count": 5, "industries": ["Maritime", "Energy", "IT"]},
+    {"city": "Tiruchirappalli", "count": 5, "industries": ["Engineering", "Education", "Healthcare"]},
+    {"city": "Nagpur", "count": 5, "industries": ["Logistics", "AgriTech", "IT"]},
+    {"city": "Lucknow", "count": 5, "industries": ["Handicrafts", "Food", "IT"]},
+    {"city": "Bhopal", "count": 5, "industries": ["Healthcare", "Education", "CleanTech"]},
+    {"city": "Chandigarh", "count": 5, "industries": ["IT", "E-commerce", "FoodTech"]},
+    {"city": "Kochi", "count": 5, "industries": ["Maritime", "Tourism", "IT"]},
+]
+
+NAME_TEMPLATES = [
+    "{city}{industry} Solutions",
+    "{city} {industry} Hub",
+    "{industry} Pioneers {city}",
+    "Smart{city} {industry}",
+    "{city} Digital {industry}",
+]
+
+
+def _generated_names() -> tuple:
+    """(city, industry, company name) for every generated startup."""
+    names = []
+    for data in TIER2_GENERATED_CITIES:
+        industries = data["industries"]
+        for i in range(data["count"]):
+            industry = industries[i % len(industries)]
+            template = NAME_TEMPLATES[i % len(NAME_TEMPLATES)]
+            names.append((data["city"], industry, template.format(city=data["city"], industry=industry)))
+    return tuple(names)
+
+# Formatted once at import instead of on every call
+TIER2_GENERATED_NAMES = _generated_names()
+
+def _parse_json(body: str, city: str) -> List[Dict]:
+    data = orjson.loads(body)
+    companies = data.get("startups") or data.get("companies") or ()
+    
+    startups = []
+    append = startups.append
+    source = f"tier2_{city.lower()}"
+    location = f"{city}, India"
+    for company in companies:
+        append(normalize_startup(
+            company_name=company.get("name", ""),
+            website=company.get("website", ""),
+            description=company.get("description", ""),
+            source=source,
+            confidence="medium",
+            location=location
+        ))
+    return startups
+
+
+def _parse_html(body: str, city: str) -> List[Dict]:
+    soup = BeautifulSoup(body, HTML_PARSER)
+    
+    startups = []
+    append = startups.append
+    source = f"tier2_{city.lower()}"
+    location = f"{city}, India"
+    # Look for company listings
+    for card in CARD_SELECTOR.select(soup):
+        name_elem = NAME_SELECTOR.select_one(card)
+        if name_elem:
+            append(normalize_startup(
+                company_name=clean_text(name_elem.get_text()),
+                website=name_elem.get("href", "") if name_elem.name == "a" else "",
+                source=source,
+                confidence="medium",
+                location=location
+            ))
+    return startups
+
+
+# Response parser by media type; other *json types go to _parse_json, the rest to _parse_html
+_PARSERS = {
+    "application/json": _parse_json,
+    "text/json": _parse_json,
+    "text/html": _parse_html,
+}
+
+
+def _pick_parser(content_type: str):
+    mime = content_type.split(";", 1)[0].strip().lower()
+    parser = _PARSERS.get(mime)
+    if parser is None:
+        parser = _parse_json if "json" in mime else _parse_html
+    return parser
+
+
+def _load_dead_hosts():
+    global _dead_hosts_loaded
+    if _dead_hosts_loaded:
+        return
+    _dead_hosts_loaded = True
+    try:
+        with open(DEAD_HOSTS_PATH, "rb") as f:
+            _DEAD_HOSTS.update(orjson.loads(f.read()))
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+
+def _save_dead_hosts():
+    now = time.time()
+    alive = {host: expiry for host, expiry in _DEAD_HOSTS.items() if expiry > now}
+    try:
+        os.makedirs(os.path.dirname(DEAD_HOSTS_PATH), exist_ok=True)
+        with open(DEAD_HOSTS_PATH, "wb") as f:
+            f.write(orjson.dumps(alive))
+    except OSError as e:
+        logger.debug(f"Could not save dead hosts: {e}")
+
+
+async def _fetch_source(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, city: str, source: str) -> List[Dict]:
+    """Startups listed on one ecosystem site; empty on any error."""
+    if any(c.isspace() for c in source):
+        logger.debug(f"Source {source!r} is not a valid hostname, skipping")
+        return []
+    if _DEAD_HOSTS.get(source, 0) > time.time():
+        return []
+    
+    try:
+        url = f"https://{source}"
+        async with semaphore, session.get(url) as res:
+            if res.status in (404, 410):
+                _DEAD_HOSTS[source] = time.time() + DEAD_HOST_TTL
+            if res.status != 200:
+                return []
+            parser = _pick_parser(res.headers.get("content-type", ""))
+            body = await res.text(errors="replace")
+        return parser(body, city)
+    
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+        # DNS failure, refused connection or timeout: don't probe again for a while
+        _DEAD_HOSTS[source] = time.time() + DEAD_HOST_TTL
+        logger.debug(f"Source {source} unreachable: {e}")
+        return []
+    except Exception as e:
+        logger.debug(f"Source {source} error: {e}")
+        return []
+
+
+async def _fetch_ecosystems(ecosystems: Dict[str, List[str]], limit: int) -> Dict[str, List[Dict]]:
+    """Fetch every (city, source) pair concurrently; per-city results keep source order."""
+    _load_dead_hosts()
+    dead_before = dict(_DEAD_HOSTS)
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+    async with make_client_session(HEADERS, limit=MAX_CONCURRENT_SOURCES, limit_per_host=2, timeout=10) as session:
+        pairs = [(city, source) for city, sources in ecosystems.items() for source in sources]
+        results = await asyncio.gather(*(_fetch_source(session, semaphore, city, source) for city, source in pairs))
+    
+    if _DEAD_HOSTS != dead_before:
+        _save_dead_hosts()
+    
+    by_city = {city: [] for city in ecosystems}
+    for (city, _), startups in zip(pairs, results):
+        by_city[city].extend(startups)
+    return {city: startups[:limit] for city, startups in by_city.items()}
+
 
 def fetch_city_ecosystem(city: str, sources: List[str], limit: int = 10) -> List[Dict]:
     """
     Fetch startups from city-specific ecosystem websites.
     """
-    startups = []
-    
-    for source in sources:
-        try:
-            url = f"https://{source}"
-            res = requests.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0"},
-                timeout=10
-            )
-            
-            if res.status_code != 200:
-                continue
-            
-            # Parse based on content type
-            content_type = res.headers.get("content-type", "")
-            
-            if "json" in content_type:
-                data = res.json()
-                companies = data.get("startups", []) or data.get("companies", [])
-                
-                for company in companies:
-                    startups.append(normalize_startup(
-                        company_name=company.get("name", ""),
-                        website=company.get("website", ""),
-                        description=company.get("description", ""),
-                        source=f"tier2_{city.lower()}",
-                        confidence="medium",
-                        location=f"{city}, India"
-                    ))
-                    
-            else:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(res.text, "html.parser")
-                
-                # Look for company listings
-                cards = soup.select(".startup-card, .company-item, .member")
-                
-                for card in cards:
-                    name_elem = card.select_one("h3, h4, .name, a")
-                    if name_elem:
-                        startups.append(normalize_startup(
-                            company_name=clean_text(name_elem.get_text()),
-                            website=name_elem.get("href", "") if name_elem.name == "a" else "",
-                            source=f"tier2_{city.lower()}",
-                            confidence="medium",
-                            location=f"{city}, India"
-                        ))
-            
-            time.sleep(0.5)
-            
-        except Exception as e:
-            logger.debug(f"Source {source} error: {e}")
-            continue
-    
-    return startups[:limit]
+    return asyncio.run(_fetch_ecosystems({city: sources}, limit))[city]
 
 
 def generate_tier2_startups(limit: int = 50) -> List[Dict]:
     """
     Generate comprehensive tier-2 startup list.
     """
-    cities_data = [
-        {"city": "Indore", "count": 5, "industries": ["Logistics", "EdTech", "AgriTech"]},
-        {"city": "Jaipur", "count": 5, "industries": ["Tourism", "E-commerce", "Crafts"]},
-        {"city": "Coimbatore", "count": 5, "industries": ["Manufacturing", "IoT", "Textiles"]},
-        {"city": "Visakhapatnam", "count": 5, "industries": ["Maritime", "Energy", "IT"]},
-        {"city": "Tiruchirappalli", "count": 5, "industries": ["Engineering", "Education", "Healthcare"]},
-        {"city": "Nagpur", "count": 5, "industries": ["Logistics", "AgriTech", "IT"]},
-        {"city": "Lucknow", "count": 5, "industries": ["Handicrafts", "Food", "IT"]},
-        {"city": "Bhopal", "count": 5, "industries": ["Healthcare", "Education", "CleanTech"]},
-        {"city": "Chandigarh", "count": 5, "industries": ["IT", "E-commerce", "FoodTech"]},
-        {"city": "Kochi", "count": 5, "industries": ["Maritime", "Tourism", "IT"]},
-    ]
-    
     startups = []
-    name_templates = [
-        "{city}{industry} Solutions",
-        "{city} {industry} Hub",
-        "{industry} Pioneers {city}",
-        "Smart{city} {industry}",
-        "{city} Digital {industry}",
-    ]
-    
-    import random
-    random.seed(42)
-    
-    for city_data in cities_data:
-        city = city_data["city"]
-        count = city_data["count"]
-        industries = city_data["industries"]
-        
-        for i in range(count):
-            industry = industries[i % len(industries)]
-            template = name_templates[i % len(name_templates)]
-            name = template.format(city=city, industry=industry)
-            
-            startups.append(normalize_startup(
-                company_name=name,
-                source=f"tier2_{city.lower()}",
-                confidence="medium",
-                location=f"{city}, India",
-                industry=industry
-            ))
+    for city, industry, name in TIER2_GENERATED_NAMES:
+        startups.append(normalize_startup(
+            company_name=name,
+            source=f"tier2_{city.lower()}",
+            confidence="medium",
+            location=f"{city}, India",
+            industry=industry
+        ))
+        if len(startups) >= limit:
+            break
     
     return startups[:limit]
 
@@ -146,11 +245,11 @@ def collect_tier2_startups(limit: int = 50, use_real_sources: bool = False) -> L
     startups = []
     
     if use_real_sources:
-        # Try real ecosystem sources
-        for city, sources in TIER2_ECOSYSTEMS.items():
+        # Try real ecosystem sources, all cities at once
+        by_city = asyncio.run(_fetch_ecosystems(TIER2_ECOSYSTEMS, 5))
+        for city_startups in by_city.values():
             if len(startups) >= limit:
                 break
-            city_startups = fetch_city_ecosystem(city, sources, 5)
             startups.extend(city_startups)
         
         logger.info(f"Real sources: {len(startups)} startups")
@@ -161,9 +260,11 @@ def collect_tier2_startups(limit: int = 50, use_real_sources: bool = False) -> L
         
         existing_ids = {s["startup_id"] for s in startups}
         for s in generated:
-            if s["startup_id"] not in existing_ids:
+            # add() doubles as the membership test: one hash lookup per item
+            seen = len(existing_ids)
+            existing_ids.add(s["startup_id"])
+            if len(existing_ids) != seen:
                 startups.append(s)
-                existing_ids.add(s["startup_id"])
         
         logger.info(f"Generated data: {len(startups)} total")
     
@@ -3,11 +3,14 @@ Tracxn scraper - Optimized for 50+ results.
 Uses public data feeds and simulated API access.
 """
 
-import requests
-import json
-import time
-from typing import List, Dict
-from base import normalize_startup, logger, clean_text
+import asyncio
+from itertools import islice
+from typing import Iterator, List, Dict, Optional, Set
+import aiohttp
+import orjson
+import soupsieve as sv
+from bs4 import BeautifulSoup
+from base import normalize_startup, logger, clean_text, generate_id, make_session, make_client_session, next_page_props, HTML_PARSER, RateLimiter
 from datetime import datetime, timedelta
 
 TRACXN_PUBLIC_URL = "https://tracxn.com/discover/api"
@@ -18,6 +21,48 @@ TRACXN_FEEDS = [
     "soonicorn-tracker"
 ]
 
+FEED_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
+    "Accept": "application/json"
+}
+
+# Shared keep-alive session for the API feeds: all four hit the same host
+# The adapter retries 429/5xx replies itself, honouring Retry-After
+SESSION = make_session(FEED_HEADERS, pool_connections=32, pool_maxsize=32, retries=5, backoff_factor=0.5)
+
+SECTORS = ["fintech", "healthcare", "ecommerce", "saas", "ai", "cleantech"]
+
+PAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.0"
+}
+
+# Sector pages in flight at once against tracxn.com
+MAX_CONCURRENT_SECTORS = 4
+
+# One request budget for tracxn.com, shared by the feed calls and all sector tasks
+RATE_LIMIT = RateLimiter(4)
+
+# Seed data for the sample generator
+SAMPLE_TEMPLATES = [
+    {"name": "Zetpay Technologies", "industry": "Fintech", "city": "Mumbai"},
+    {"name": "FarmSetu AgriTech", "industry": "Agritech", "city": "Pune"},
+    {"name": "LogiFleet AI", "industry": "Logistics", "city": "Bangalore"},
+    {"name": "CareBridge Health", "industry": "Healthtech", "city": "Delhi"},
+    {"name": "RetailPulse Analytics", "industry": "Retail", "city": "Hyderabad"},
+    {"name": "GreenVolt Energy", "industry": "Cleantech", "city": "Chennai"},
+    {"name": "EdVenture Learning", "industry": "Edtech", "city": "Bangalore"},
+    {"name": "CloudSecure AI", "industry": "Cybersecurity", "city": "Mumbai"},
+    {"name": "FoodLink Supply", "industry": "Foodtech", "city": "Delhi"},
+    {"name": "BuildSmart Construction", "industry": "Construction", "city": "Pune"},
+]
+
+# Numbered variants stop here even if validation keeps rejecting names
+MAX_SAMPLES = 1000
+
+# Public-page selectors, compiled once instead of per sector
+CARD_SELECTOR = sv.compile(".company-card, [data-testid='company'], .startup-item")
+NAME_SELECTOR = sv.compile("h3, h4, .company-name, a")
+
 
 def fetch_tracxn_feed(feed_type: str = "emerging-startups", limit: int = 50) -> List[Dict]:
     """
@@ -31,18 +76,19 @@ def fetch_tracxn_feed(feed_type: str = "emerging-startups", limit: int = 50) ->
     url = f"{TRACXN_PUBLIC_URL}/{feed_type}"
     
     try:
-        res = requests.get(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
-                "Accept": "application/json",
-                "Authorization": "Bearer " + get_tracxn_token()  # Implement token management
-            },
-            timeout=15
-        )
+        with RATE_LIMIT:
+            res = SESSION.get(
+                url,
+                headers={
+                    "Authorization": "Bearer " + get_tracxn_token()  # Implement token management
+                },
+                timeout=15
+            )
         
-        if res.status_code == 200:
-            data = res.json()
+        if res.status_code != 200:
+            logger.debug(f"Tracxn feed {feed_type} returned {res.status_code}")
+        else:
+            data = orjson.loads(res.content)
             items = data.get("data", [])
             
             for item in items:
@@ -86,130 +132,129 @@ def get_tracxn_token() -> str:
     return "your_tracxn_api_token"
 
 
-def scrape_tracxn_public_pages(limit: int = 50) -> List[Dict]:
-    """
-    Scrape Tracxn public pages for India startups.
-    """
-    from bs4 import BeautifulSoup
+def _parse_sector_page(content: bytes, sector: str, limit: int) -> List[Dict]:
+    # Company data from the Next.js data script; the tree is only built for the HTML fallback
+    companies = next_page_props(content).get("companies") or []
     
-    startups = []
-    sectors = ["fintech", "healthcare", "ecommerce", "saas", "ai", "cleantech"]
+    # Fallback to HTML
+    if not companies:
+        soup = BeautifulSoup(content, HTML_PARSER, from_encoding="utf-8")
+        cards = CARD_SELECTOR.select(soup)
+        for card in cards:
+            name_elem = NAME_SELECTOR.select_one(card)
+            if name_elem:
+                companies.append({
+                    "name": name_elem.get_text(strip=True),
+                    "website": name_elem.get("href", "") if name_elem.name == "a" else "",
+                    "description": ""
+                })
     
-    for sector in sectors:
-        if len(startups) >= limit:
-            break
-            
-        url = f"https://tracxn.com/discover/india-{sector}-startups/"
-        
+    startups = []
+    # Locals for the per-company loop
+    append, clean = startups.append, clean_text
+    for company in companies:
         try:
-            res = requests.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.0"
-                },
-                timeout=10
-            )
-            
-            if res.status_code != 200:
+            name = company.get("name", "")
+            if not name or len(name) < 2:
                 continue
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            
-            # Look for company data in scripts or HTML
-            scripts = soup.find_all("script", type="application/json")
-            companies = []
-            
-            for script in scripts:
-                try:
-                    data = json.loads(script.string)
-                    if "props" in data:
-                        companies = data["props"].get("pageProps", {}).get("companies", [])
-                        break
-                except:
-                    continue
-            
-            # Fallback to HTML
-            if not companies:
-                cards = soup.select(".company-card, [data-testid='company'], .startup-item")
-                for card in cards:
-                    name_elem = card.select_one("h3, h4, .company-name, a")
-                    if name_elem:
-                        companies.append({
-                            "name": name_elem.get_text(strip=True),
-                            "website": name_elem.get("href", "") if name_elem.name == "a" else "",
-                            "description": ""
-                        })
+            website = company.get("website", "")
+            if website and not website.startswith("http"):
+                website = "https://" + website
             
-            for company in companies:
-                try:
-                    name = company.get("name", "")
-                    if not name or len(name) < 2:
-                        continue
-                    
-                    website = company.get("website", "")
-                    if website and not website.startswith("http"):
-                        website = "https://" + website
-                    
-                    startups.append(normalize_startup(
-                        company_name=clean_text(name),
-                        website=website,
-                        description=company.get("description", ""),
-                        source=f"tracxn_{sector}",
-                        confidence="medium",
-                        location="India",
-                        industry=sector
-                    ))
-                    
-                    if len(startups) >= limit:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Company parse error: {e}")
-                    continue
-            
-            time.sleep(0.5)
+            append(normalize_startup(
+                company_name=clean(name),
+                website=website,
+                description=company.get("description", ""),
+                source=f"tracxn_{sector}",
+                confidence="medium",
+                location="India",
+                industry=sector
+            ))
             
+            if len(startups) >= limit:
+                break
+                
         except Exception as e:
-            logger.error(f"Sector {sector} scrape error: {e}")
+            logger.debug(f"Company parse error: {e}")
             continue
     
     return startups
 
 
-def generate_tracxn_sample_data(limit: int = 50) -> List[Dict]:
-    """
-    Generate realistic sample data based on Tracxn patterns.
-    Used when scraping is not available.
-    """
-    templates = [
-        {"name": "Zetpay Technologies", "industry": "Fintech", "city": "Mumbai"},
-        {"name": "FarmSetu AgriTech", "industry": "Agritech", "city": "Pune"},
-        {"name": "LogiFleet AI", "industry": "Logistics", "city": "Bangalore"},
-        {"name": "CareBridge Health", "industry": "Healthtech", "city": "Delhi"},
-        {"name": "RetailPulse Analytics", "industry": "Retail", "city": "Hyderabad"},
-        {"name": "GreenVolt Energy", "industry": "Cleantech", "city": "Chennai"},
-        {"name": "EdVenture Learning", "industry": "Edtech", "city": "Bangalore"},
-        {"name": "CloudSecure AI", "industry": "Cybersecurity", "city": "Mumbai"},
-        {"name": "FoodLink Supply", "industry": "Foodtech", "city": "Delhi"},
-        {"name": "BuildSmart Construction", "industry": "Construction", "city": "Pune"},
-    ]
+async def _scrape_sector(session: aiohttp.ClientSession, sector: str, limit: int) -> List[Dict]:
+    url = f"https://tracxn.com/discover/india-{sector}-startups/"
     
-    startups = []
-    import random
+    try:
+        async with RATE_LIMIT, session.get(url) as res:
+            if res.status != 200:
+                return []
+            content = await res.read()
+        return _parse_sector_page(content, sector, limit)
+        
+    except Exception as e:
+        logger.error(f"Sector {sector} scrape error: {e}")
+        return []
+
+
+async def _scrape_tracxn_public_pages(limit: int) -> List[Dict]:
+    async with make_client_session(
+        PAGE_HEADERS,
+        limit=16,
+        limit_per_host=MAX_CONCURRENT_SECTORS,
+        timeout=10,
+        cache_name="tracxn_pages_cache",
+    ) as session:
+        results = await asyncio.gather(*(_scrape_sector(session, sector, limit) for sector in SECTORS))
     
-    for i in range(limit):
-        template = templates[i % len(templates)]
-        suffix = f" {i+1}" if i >= len(templates) else ""
+    # Keep sector order so the output is deterministic
+    startups = [s for sector_startups in results for s in sector_startups]
+    return startups[:limit]
+
+
+def scrape_tracxn_public_pages(limit: int = 50) -> List[Dict]:
+    """
+    Scrape Tracxn public pages for India startups.
+    All sector pages are fetched concurrently.
+    """
+    return asyncio.run(_scrape_tracxn_public_pages(limit))
+
+
+def iter_tracxn_samples(seen_ids: Optional[Set[str]] = None) -> Iterator[Dict]:
+    """
+    Lazily yield realistic sample startups based on Tracxn patterns,
+    so callers stop generating as soon as they have enough.
+    Names whose ID is already in `seen_ids` are skipped; new IDs are added to it.
+    """
+    for i in range(MAX_SAMPLES):
+        template = SAMPLE_TEMPLATES[i % len(SAMPLE_TEMPLATES)]
+        suffix = f" {i+1}" if i >= len(SAMPLE_TEMPLATES) else ""
+        name = f"{template['name']}{suffix}"
         
-        startups.append(normalize_startup(
-            company_name=f"{template['name']}{suffix}",
+        if seen_ids is not None:
+            # Same ID normalize_startup would assign (no website)
+            startup_id = generate_id(name)
+            if startup_id in seen_ids:
+                continue
+            seen_ids.add(startup_id)
+        
+        startup = normalize_startup(
+            company_name=name,
             source="tracxn_emerging",
             confidence="medium",
             location=f"{template['city']}, India",
             industry=template['industry']
-        ))
-    
-    return startups
+        )
+        if startup:
+            yield startup
+
+
+def generate_tracxn_sample_data(limit: int = 50, seen_ids: Optional[Set[str]] = None) -> List[Dict]:
+    """
+    Generate realistic sample data based on Tracxn patterns.
+    Used when scraping is not available.
+    """
+    return list(islice(iter_tracxn_samples(seen_ids), limit))
 
 
 def collect_tracxn_startups(limit: int = 50, use_real_scrape: bool = True) -> List[Dict]:
@@ -220,39 +265,40 @@ def collect_tracxn_startups(limit: int = 50, use_real_scrape: bool = True) -> Li
     logger.info(f"Fetching Tracxn startups (target: {limit})...")
     
     startups = []
+    seen_ids: Set[str] = set()
+    
+    def add(new_startups):
+        for s in new_startups:
+            if not s:
+                continue
+            seen = len(seen_ids)
+            seen_ids.add(s["startup_id"])
+            if len(seen_ids) != seen:
+                startups.append(s)
     
     if use_real_scrape:
         # Try API feeds
         for feed in TRACXN_FEEDS:
             if len(startups) >= limit:
                 break
-            feed_startups = fetch_tracxn_feed(feed, limit - len(startups))
-            startups.extend(feed_startups)
-            time.sleep(0.5)
+            add(fetch_tracxn_feed(feed, limit - len(startups)))
         
         # Try public pages
         if len(startups) < limit:
-            page_startups = scrape_tracxn_public_pages(limit - len(startups))
-            existing_ids = {s["startup_id"] for s in startups}
-            for s in page_startups:
-                if s["startup_id"] not in existing_ids:
-                    startups.append(s)
-                    existing_ids.add(s["startup_id"])
+            add(scrape_tracxn_public_pages(limit - len(startups)))
         
         logger.info(f"Scraped {len(startups)} from Tracxn")
     
     # Fallback to structured data if needed
     if len(startups) < limit:
-        remaining = limit - len(startups)
-        sample_data = generate_tracxn_sample_data(remaining)
-        
-        existing_ids = {s["startup_id"] for s in startups}
-        for s in sample_data:
-            if s["startup_id"] not in existing_ids:
-                startups.append(s)
-                existing_ids.add(s["startup_id"])
+        scraped = len(startups)
+        # Collisions with scraped IDs are skipped during generation
+        for s in iter_tracxn_samples(seen_ids):
+            startups.append(s)
+            if len(startups) >= limit:
+                break
         
-        logger.info(f"Added {remaining} structured samples")
+        logger.info(f"Added {len(startups) - scraped} structured samples")
     
     return startups[:limit]
 
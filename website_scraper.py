@@ -1,15 +1,37 @@
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
+from base import make_session, HTML_PARSER
+
+# Shared pooled session: keep-alive per site, retries on transient statuses
+SESSION = make_session(pool_connections=32, pool_maxsize=32, retries=1, backoff_factor=0.3)
+
+# Sites fetched at once; matches the session's connection pool
+MAX_WORKERS = 32
+MAX_PAGE_BYTES = 64 * 1024
+
+def _fetch_one(s):
+    try:
+        # Only the top of the page is used: read at most MAX_PAGE_BYTES
+        with SESSION.get(s["website"], timeout=5, stream=True) as res:
+            html = res.raw.read(MAX_PAGE_BYTES, decode_content=True)
+        soup = BeautifulSoup(html, HTML_PARSER)
+        # Meta description first, then the first paragraph; the whole
+        # document's text is only flattened when neither has any
+        meta = soup.find("meta", attrs={"name": "description"})
+        text = " ".join(meta.get("content", "").split()) if meta else ""
+        if not text:
+            paragraph = soup.find("p")
+            text = paragraph.get_text(" ", strip=True) if paragraph else ""
+        if not text:
+            text = (soup.body or soup).get_text(" ", strip=True)
+        s["description"] = text[:300]
+    except Exception:
+        pass
 
 def enrich_from_website(startups):
-    for s in startups:
-        if not s["website"] or s["description"]:
-            continue
-        try:
-            html = requests.get(s["website"], timeout=5).text
-            soup = BeautifulSoup(html, "html.parser")
-            text = soup.get_text(" ", strip=True)
-            s["description"] = text[:300]
-        except Exception:
-            pass
+    candidates = [s for s in startups if s["website"] and not s["description"]]
+    if candidates:
+        # Each fetch is network-bound and touches only its own startup dict
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(candidates))) as executor:
+            list(executor.map(_fetch_one, candidates))
     return startups
\ No newline at end of file
@@ -3,201 +3,330 @@ Y Combinator India startups scraper - Optimized for 50+ results.
 Uses official YC API and directory scraping.
 """
 
-import requests
-import json
-import time
-from typing import List, Dict
-from base import normalize_startup, logger, clean_text
+import asyncio
+from typing import List, Dict, Optional, Tuple
+import aiohttp
+import orjson
+import soupsieve as sv
+from bs4 import BeautifulSoup
+from base import normalize_startup, logger, clean_text, make_client_session, get_with_retry, next_page_props, HTML_PARSER
 
 YC_API_URL = "https://api.ycombinator.com/v0.1/companies"
 YC_DIRECTORY_URL = "https://www.ycombinator.com/companies"
 BATCHES = ["W24", "S23", "W23", "S22", "W22", "S21", "W21", "S20", "W20"]
 
+API_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
+    "Accept": "application/json"
+}
+DIRECTORY_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.0"
+}
+
+# City names (and "india" itself) that mark an API location as Indian
+INDIA_TOKENS = frozenset({
+    "india", "bengaluru", "bangalore", "mumbai", "delhi", "new delhi",
+    "hyderabad", "pune", "chennai", "kolkata", "gurugram", "gurgaon", "noida",
+})
+
+# YC API page size, and pages requested at once once the total is known
+API_PAGE_SIZE = 50
+API_CONCURRENCY = 4
+
+# Directory pages in flight at once against ycombinator.com
+MAX_CONCURRENT_PAGES = 4
+
+# Directory card selectors, compiled once instead of per page
+CARD_SELECTOR = sv.compile("[data-testid='company-card'], .company-card, ._company")
+NAME_SELECTOR = sv.compile("h3, h4, .company-name")
+NEXT_PAGE_SELECTOR = sv.compile("[data-testid='next-page'], .next, a[rel='next']")
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # directory pages then go through BeautifulSoup
+    lxml = None
+else:
+    def _has_class(name: str) -> str:
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+    
+    # The same three selectors as XPath, evaluated in C on the lxml tree
+    CARD_XPATH = etree.XPath(f"//*[@data-testid='company-card' or {_has_class('company-card')} or {_has_class('_company')}]")
+    NAME_XPATH = etree.XPath(f"(.//*[self::h3 or self::h4 or {_has_class('company-name')}])[1]")
+    NEXT_PAGE_XPATH = etree.XPath(f"(//*[@data-testid='next-page' or {_has_class('next')}] | //a[@rel='next'])[1]")
+    DIRECTORY_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def _is_india_location(loc: Dict) -> bool:
+    # Country by prefix ("India", "India (Remote)"), city by set lookup; each
+    # lowercases a short string once and short-circuits on the first match
+    country = loc.get("country") or ""
+    city = loc.get("city") or ""
+    return country[:5].lower() == "india" or city.lower() in INDIA_TOKENS
+
+
+def _format_locations(locations: List[Dict]) -> str:
+    """Comma-joined "city, country" per location; most companies have just one."""
+    if len(locations) == 1:
+        loc = locations[0]
+        return f"{loc.get('city', '')}, {loc.get('country', '')}"
+    return ", ".join(f"{loc.get('city', '')}, {loc.get('country', '')}" for loc in locations)
+
+
+def _parse_api_companies(companies: List[Dict], location: str, startups: List[Dict], limit: int):
+    """Append the companies on one API page to `startups`, up to `limit`."""
+    for company in companies:
+        try:
+            # Filter for India specifically
+            locations = company.get("locations", [])
+            is_india = any(_is_india_location(loc) for loc in locations)
+            
+            if not is_india and location == "india":
+                continue
+            
+            website = company.get("website", "") or company.get("url", "")
+            if website and not website.startswith("http"):
+                website = "https://" + website
+            
+            startup = normalize_startup(
+                company_name=company.get("name", ""),
+                website=website,
+                description=company.get("description", "") or company.get("one_liner", ""),
+                source=f"yc_{company.get('batch', 'unknown')}",
+                confidence="high",
+                location=_format_locations(locations),
+                funding_stage="seed" if "S" in company.get("batch", "") else "series_a",
+                industry=", ".join(company.get("industries", []))
+            )
+            # None when validation rejects the name
+            if startup:
+                startups.append(startup)
+            
+            if len(startups) >= limit:
+                break
+                
+        except Exception as e:
+            logger.debug(f"Company parse error: {e}")
+            continue
+
+
+async def _fetch_api_page(session: aiohttp.ClientSession, location: str, offset: int) -> Optional[Dict]:
+    """One page of the YC API; None on errors or non-200 replies."""
+    params = {
+        "location": location,
+        "offset": offset,
+        "limit": API_PAGE_SIZE
+    }
+    
+    try:
+        # 429/5xx replies are retried with backoff before giving up on the page
+        res, body = await get_with_retry(session, YC_API_URL, retries=5, params=params)
+        if res.status != 200:
+            logger.debug(f"YC API offset {offset} returned {res.status}")
+            return None
+        return orjson.loads(body)
+    except Exception as e:
+        logger.error(f"YC API error: {e}")
+        return None
+
+
+async def _fetch_yc_api(location: str, limit: int) -> List[Dict]:
+    startups = []
+    
+    async with make_client_session(API_HEADERS, limit=API_CONCURRENCY, limit_per_host=API_CONCURRENCY, timeout=15) as session:
+        data = await _fetch_api_page(session, location, 0)
+        companies = data.get("companies", []) if data else []
+        if not companies:
+            return startups
+        _parse_api_companies(companies, location, startups, limit)
+        offset = len(companies)
+        more = len(companies) >= API_PAGE_SIZE
+        total = data.get("total")
+        
+        # The first page reports the total: request the following pages in
+        # waves of API_CONCURRENCY, consuming each wave in offset order
+        if isinstance(total, int):
+            while more and len(startups) < limit and offset < total:
+                offsets = range(offset, min(total, offset + API_CONCURRENCY * API_PAGE_SIZE), API_PAGE_SIZE)
+                pages = await asyncio.gather(*(_fetch_api_page(session, location, o) for o in offsets))
+                for page in pages:
+                    companies = page.get("companies", []) if page else []
+                    if not companies or len(startups) >= limit:
+                        more = False
+                        break
+                    _parse_api_companies(companies, location, startups, limit)
+                    offset += len(companies)
+                    if len(companies) < API_PAGE_SIZE:
+                        more = False
+                        break
+        
+        # No total: follow the pages one at a time
+        while more and len(startups) < limit:
+            # Politeness delay between pages; doesn't block other coroutines
+            await asyncio.sleep(0.3)
+            data = await _fetch_api_page(session, location, offset)
+            companies = data.get("companies", []) if data else []
+            if not companies:
+                break
+            _parse_api_companies(companies, location, startups, limit)
+            offset += len(companies)
+            more = len(companies) >= API_PAGE_SIZE
+    
+    return startups
+
 
 def fetch_yc_api(location: str = "india", limit: int = 50) -> List[Dict]:
     """
     Fetch from Y Combinator's public API.
     """
-    startups = []
-    offset = 0
+    return asyncio.run(_fetch_yc_api(location, limit))
+
+
+def _directory_cards_lxml(content: bytes) -> Tuple[List[str], bool]:
+    """Card names on a directory page, and whether a next page exists."""
+    try:
+        doc = lxml.html.fromstring(content, parser=DIRECTORY_PARSER)
+    except etree.ParserError:  # empty document
+        return [], False
     
-    while len(startups) < limit:
-        params = {
-            "location": location,
-            "offset": offset,
-            "limit": 50
-        }
-        
+    names = []
+    for card in CARD_XPATH(doc):
+        name_elem = NAME_XPATH(card)
+        if name_elem:
+            names.append("".join(text.strip() for text in name_elem[0].itertext()))
+    
+    next_btn = NEXT_PAGE_XPATH(doc)
+    has_next = bool(next_btn) and b"disabled" not in etree.tostring(next_btn[0], with_tail=False)
+    return names, has_next
+
+
+def _directory_cards_soup(content: bytes) -> Tuple[List[str], bool]:
+    """BeautifulSoup version of _directory_cards_lxml, for installs without lxml."""
+    soup = BeautifulSoup(content, HTML_PARSER, from_encoding="utf-8")
+    
+    names = []
+    for card in CARD_SELECTOR.select(soup):
+        name_elem = NAME_SELECTOR.select_one(card)
+        if name_elem:
+            names.append(name_elem.get_text(strip=True))
+    
+    next_btn = NEXT_PAGE_SELECTOR.select_one(soup)
+    has_next = bool(next_btn) and "disabled" not in str(next_btn)
+    return names, has_next
+
+
+_directory_cards = _directory_cards_soup if lxml is None else _directory_cards_lxml
+
+
+def _parse_directory_page(content: bytes, batch: str) -> Tuple[List[Dict], bool]:
+    """Startups on one directory page, and whether a next page exists."""
+    # Next.js page data, decoded straight from the response bytes
+    companies = next_page_props(content).get("companies") or []
+    card_names, has_next = _directory_cards(content)
+    
+    # Fallback to HTML parsing
+    if not companies:
+        companies = [{"name": name, "website": "", "description": ""} for name in card_names]
+    
+    startups = []
+    # Locals for the per-company loop
+    append, clean = startups.append, clean_text
+    for company in companies:
         try:
-            res = requests.get(
-                YC_API_URL,
-                params=params,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.0",
-                    "Accept": "application/json"
-                },
-                timeout=15
-            )
+            name = company.get("name") or company.get("company_name", "")
+            if not name:
+                continue
             
-            if res.status_code != 200:
-                break
+            # Verify India connection
+            locations = company.get("locations", [])
+            if locations:
+                is_india = any("india" in str(loc).lower() for loc in locations)
+                if not is_india:
+                    continue
             
-            data = res.json()
-            companies = data.get("companies", [])
+            website = company.get("website", "") or company.get("url", "")
+            if website and not website.startswith("http"):
+                website = "https://" + website
             
-            if not companies:
-                break
+            startup = normalize_startup(
+                company_name=clean(name),
+                website=website,
+                description=company.get("description", "") or company.get("one_liner", ""),
+                source=f"yc_{batch}",
+                confidence="high",
+                location="India",
+                funding_stage="seed" if batch.startswith("S") else "series_a"
+            )
+            if startup:
+                append(startup)
             
-            for company in companies:
-                try:
-                    # Filter for India specifically
-                    locations = company.get("locations", [])
-                    is_india = any(
-                        "india" in loc.get("country", "").lower() or 
-                        "india" in loc.get("city", "").lower()
-                        for loc in locations
-                    )
-                    
-                    if not is_india and location == "india":
-                        continue
-                    
-                    website = company.get("website", "") or company.get("url", "")
-                    if website and not website.startswith("http"):
-                        website = "https://" + website
-                    
-                    startups.append(normalize_startup(
-                        company_name=company.get("name", ""),
-                        website=website,
-                        description=company.get("description", "") or company.get("one_liner", ""),
-                        source=f"yc_{company.get('batch', 'unknown')}",
-                        confidence="high",
-                        location=", ".join([f"{loc.get('city', '')}, {loc.get('country', '')}" for loc in locations]),
-                        funding_stage="seed" if "S" in company.get("batch", "") else "series_a",
-                        industry=", ".join(company.get("industries", []))
-                    ))
-                    
-                    if len(startups) >= limit:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Company parse error: {e}")
-                    continue
+        except Exception as e:
+            logger.debug(f"Company parse error: {e}")
+            continue
+    
+    return startups, has_next
+
+
+async def _scrape_batch(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, batch: str, limit: int) -> List[Dict]:
+    """Page through one batch; pages within a batch stay sequential (next-page link)."""
+    startups = []
+    url = f"{YC_DIRECTORY_URL}?batch={batch}&location=India"
+    page = 1
+    
+    while len(startups) < limit:
+        paginated_url = f"{url}&page={page}"
+        
+        try:
+            async with semaphore, session.get(paginated_url) as res:
+                if res.status != 200:
+                    break
+                content = await res.read()
             
-            offset += len(companies)
-            time.sleep(0.3)
+            page_startups, has_next = _parse_directory_page(content, batch)
+            startups.extend(page_startups)
             
-            if len(companies) < 50:
+            page += 1
+            if not has_next:
                 break
                 
         except Exception as e:
-            logger.error(f"YC API error: {e}")
+            logger.error(f"Batch {batch} scrape error: {e}")
             break
     
     return startups
 
 
+async def _scrape_yc_directory_by_batch(limit: int) -> List[Dict]:
+    # At most MAX_CONCURRENT_PAGES directory requests in flight, across all batches
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+    async with make_client_session(
+        DIRECTORY_HEADERS,
+        limit=16,
+        limit_per_host=MAX_CONCURRENT_PAGES,
+        timeout=10,
+        cache_name="yc_directory_cache",
+    ) as session:
+        results = await asyncio.gather(
+            *(_scrape_batch(session, semaphore, batch, limit) for batch in BATCHES),
+            return_exceptions=True
+        )
+    
+    # Keep batch order so the output is deterministic
+    startups = []
+    for batch, batch_startups in zip(BATCHES, results):
+        if isinstance(batch_startups, BaseException):
+            logger.error(f"Batch {batch} scrape error: {batch_startups}")
+            continue
+        startups.extend(batch_startups)
+    return startups[:limit]
+
+
 def scrape_yc_directory_by_batch(limit: int = 50) -> List[Dict]:
     """
     Scrape YC directory by batch for India companies.
+    All batches are fetched concurrently.
     """
-    from bs4 import BeautifulSoup
-    
-    startups = []
-    
-    for batch in BATCHES:
-        if len(startups) >= limit:
-            break
-            
-        url = f"{YC_DIRECTORY_URL}?batch={batch}&location=India"
-        page = 1
-        
-        while len(startups) < limit:
-            paginated_url = f"{url}&page={page}"
-            
-            try:
-                res = requests.get(
-                    paginated_url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.0"
-                    },
-                    timeout=10
-                )
-                
-                if res.status_code != 200:
-                    break
-                
-                soup = BeautifulSoup(res.text, "html.parser")
-                
-                # Look for JSON data in script tags (Next.js)
-                scripts = soup.find_all("script", type="application/json")
-                companies = []
-                
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        # Navigate through Next.js data structure
-                        if "props" in data and "pageProps" in data["props"]:
-                            companies = data["props"]["pageProps"].get("companies", [])
-                            break
-                    except:
-                        continue
-                
-                # Fallback to HTML parsing
-                if not companies:
-                    cards = soup.select("[data-testid='company-card'], .company-card, ._company")
-                    for card in cards:
-                        name_elem = card.select_one("h3, h4, .company-name")
-                        if name_elem:
-                            companies.append({
-                                "name": name_elem.get_text(strip=True),
-                                "website": "",
-                                "description": ""
-                            })
-                
-                for company in companies:
-                    try:
-                        name = company.get("name") or company.get("company_name", "")
-                        if not name:
-                            continue
-                        
-                        # Verify India connection
-                        locations = company.get("locations", [])
-                        if locations:
-                            is_india = any("india" in str(loc).lower() for loc in locations)
-                            if not is_india:
-                                continue
-                        
-                        website = company.get("website", "") or company.get("url", "")
-                        if website and not website.startswith("http"):
-                            website = "https://" + website
-                        
-                        startups.append(normalize_startup(
-                            company_name=clean_text(name),
-                            website=website,
-                            description=company.get("description", "") or company.get("one_liner", ""),
-                            source=f"yc_{batch}",
-                            confidence="high",
-                            location="India",
-                            funding_stage="seed" if batch.startswith("S") else "series_a"
-                        ))
-                        
-                    except Exception as e:
-                        logger.debug(f"Company parse error: {e}")
-                        continue
-                
-                page += 1
-                time.sleep(0.5)
-                
-                # Check for next page
-                next_btn = soup.select_one("[data-testid='next-page'], .next, a[rel='next']")
-                if not next_btn or "disabled" in str(next_btn):
-                    break
-                    
-            except Exception as e:
-                logger.error(f"Batch {batch} scrape error: {e}")
-                break
-    
-    return startups
+    return asyncio.run(_scrape_yc_directory_by_batch(limit))
 
 
 def collect_yc_india(limit: int = 50) -> List[Dict]:
@@ -210,17 +339,21 @@ def collect_yc_india(limit: int = 50) -> List[Dict]:
     # Try API first
     startups = fetch_yc_api("india", limit)
     logger.info(f"YC API fetch: {len(startups)} startups")
+    # Built once and extended in place by every later merge
+    seen_ids = {s["startup_id"] for s in startups if s}
     
     # Supplement with directory scraping
     if len(startups) < limit:
         remaining = limit - len(startups)
         directory_startups = scrape_yc_directory_by_batch(remaining)
         
-        existing_ids = {s["startup_id"] for s in startups}
         for s in directory_startups:
-            if s["startup_id"] not in existing_ids:
+            if not s:
+                continue
+            seen = len(seen_ids)
+            seen_ids.add(s["startup_id"])
+            if len(seen_ids) != seen:
                 startups.append(s)
-                existing_ids.add(s["startup_id"])
         
         logger.info(f"After directory scrape: {len(startups)} startups")
     